@@ -0,0 +1,254 @@
+import os
+from datetime import datetime
+from typing import List, Optional, Dict, Any
+from .markdown_storage import MarkdownStorage
+from .models import StaffMember, Note, Reminder, Goal, ReminderStatus
+
+class CachedStorage:
+    """In-memory view over MarkdownStorage, reloaded when the files on disk change"""
+    
+    def __init__(self, storage: MarkdownStorage):
+        self._storage = storage
+    
+        # Parsed staff, validated by the (name, mtime, size) of every staff file
+        self._staff_stamp: Optional[tuple] = None
+        # Bumped on every reload, so callers can key their own memos on it
+        self._staff_generation = 0
+        self._staff: List[StaffMember] = []
+        self._staff_by_id: Dict[str, StaffMember] = {}
+        self._staff_by_lower_name: Dict[str, StaffMember] = {}
+        # Goals of every cached staff member by goal id, built on first lookup
+        self._goal_by_id: Optional[Dict[str, Goal]] = None
+    
+        # Parsed reminders, validated by the reminders file's (mtime, size)
+        self._reminders_stamp: Optional[tuple] = None
+        self._reminders: List[Reminder] = []
+        self._reminders_by_id: Dict[str, Reminder] = {}
+        self._reminders_by_status: Dict[str, List[Reminder]] = {}
+        self._reminders_by_staff: Dict[str, List[Reminder]] = {}
+        # Pending reminders, latest due date first, so the next to fall due is last
+        self._pending_by_due: List[Reminder] = []
+    
+    def __getattr__(self, name: str) -> Any:
+        # Everything not cached here goes straight to the underlying storage
+        return getattr(self._storage, name)
+    
+    def _stat_staff_files(self) -> tuple:
+        """Cheap fingerprint of the staff directory: one stat per file, no reads"""
+        stamp = []
+        for entry in self._storage._iter_staff_files():
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            stamp.append((entry.name, st.st_mtime_ns, st.st_size))
+        return tuple(stamp)
+    
+    def _stat_reminders_file(self) -> Optional[tuple]:
+        """Fingerprint of the reminders file, or None if it is missing"""
+        try:
+            st = os.stat(self._storage.reminders_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _fresh_staff(self) -> Dict[str, StaffMember]:
+        """Return the staff-by-id map, reloading it if any staff file changed"""
+        stamp = self._stat_staff_files()
+        if stamp != self._staff_stamp:
+            self._staff = self._storage.get_all_staff()
+            self._staff_by_id = {}
+            self._staff_by_lower_name = {}
+            for staff in self._staff:
+                self._staff_by_id.setdefault(staff.id, staff)
+                self._staff_by_lower_name.setdefault(staff.name.lower(), staff)
+            self._goal_by_id = None
+            self._staff_stamp = stamp
+            self._staff_generation += 1
+        return self._staff_by_id
+    
+    def _fresh_reminders(self) -> Dict[str, Reminder]:
+        """Return the reminder-by-id map, reloading it if the reminders file changed"""
+        stamp = self._stat_reminders_file()
+        if stamp is None or stamp != self._reminders_stamp:
+            self._reminders = self._storage.get_all_reminders()
+            self._reminders_by_id = {}
+            self._reminders_by_staff = {}
+            for reminder in self._reminders:
+                self._reminders_by_id.setdefault(reminder.id, reminder)
+                if reminder.staff_id:
+                    self._reminders_by_staff.setdefault(reminder.staff_id, []).append(reminder)
+            self._pending_by_due = sorted(
+                (r for r in self._reminders if r.status == ReminderStatus.PENDING),
+                key=lambda r: r.due_date, reverse=True,
+            )
+            self._index_reminders_by_status()
+            self._reminders_stamp = stamp
+        self._sweep_overdue()
+        return self._reminders_by_id
+    
+    def _index_reminders_by_status(self):
+        """Group the cached reminders by status, in file order"""
+        self._reminders_by_status = {}
+        for reminder in self._reminders:
+            self._reminders_by_status.setdefault(reminder.status.value, []).append(reminder)
+    
+    def _sweep_overdue(self):
+        """Mark pending reminders whose due date has passed as overdue"""
+        now = datetime.now()
+        if not self._pending_by_due or self._pending_by_due[-1].due_date >= now:
+            return
+        while self._pending_by_due and self._pending_by_due[-1].due_date < now:
+            self._pending_by_due.pop().status = ReminderStatus.OVERDUE
+        self._index_reminders_by_status()
+    
+    def _invalidate_staff(self):
+        """Force the next staff read to reload"""
+        self._staff_stamp = None
+    
+    def _invalidate_reminders(self):
+        """Force the next reminder read to reload"""
+        self._reminders_stamp = None
+    
+    def staff_generation(self) -> int:
+        """Current staff cache generation, after reloading it if anything changed"""
+        self._fresh_staff()
+        return self._staff_generation
+    
+    # Reads: callers may set fields on what they get back, so hand out copies
+    
+    def get_all_staff(self) -> List[StaffMember]:
+        """Get all staff members"""
+        self._fresh_staff()
+        return [staff.model_copy(deep=True) for staff in self._staff]
+    
+    def get_staff_by_id(self, staff_id: str) -> Optional[StaffMember]:
+        """Get staff member by ID"""
+        staff = self._fresh_staff().get(staff_id)
+        return staff.model_copy(deep=True) if staff else None
+    
+    def get_staff_by_name_ci(self, name: str) -> Optional[StaffMember]:
+        """Get staff member by case-insensitive name"""
+        self._fresh_staff()
+        staff = self._staff_by_lower_name.get(name.lower())
+        return staff.model_copy(deep=True) if staff else None
+    
+    def resolve_staff_by_names(self, names: List[str]) -> Dict[str, StaffMember]:
+        """Look up several names case-insensitively; returns lowercase name -> staff for the ones found"""
+        self._fresh_staff()
+        resolved = {}
+        for name in names:
+            key = name.lower()
+            if key not in resolved:
+                staff = self._staff_by_lower_name.get(key)
+                if staff:
+                    resolved[key] = staff.model_copy(deep=True)
+        return resolved
+    
+    def get_goals_for_staff(self, staff_id: str) -> List[Goal]:
+        """Get goals for a staff member"""
+        staff = self._fresh_staff().get(staff_id)
+        if not staff:
+            return []
+        return self.get_goals_for_staff_obj(staff)
+    
+    def get_goals_for_staff_obj(self, staff: StaffMember) -> List[Goal]:
+        """Get goals for an already-loaded staff member"""
+        return self._storage.get_goals_for_staff_obj(staff)
+    
+    def get_goal_by_id(self, goal_id: str) -> Optional[Goal]:
+        """Get a goal by ID"""
+        self._fresh_staff()
+        if self._goal_by_id is None:
+            self._goal_by_id = {}
+            for staff in self._staff:
+                for goal in self._storage.get_goals_for_staff_obj(staff):
+                    self._goal_by_id.setdefault(goal.id, goal)
+        goal = self._goal_by_id.get(goal_id)
+        return goal.model_copy(deep=True) if goal else None
+    
+    def get_notes_for_staff(self, staff_id: str) -> List[Note]:
+        """Get all notes for a staff member"""
+        staff = self._fresh_staff().get(staff_id)
+        if not staff:
+            return []
+        return self._storage.get_notes_for_staff_obj(staff)
+    
+    def count_notes_for_staff(self, staff_id: str) -> int:
+        """Number of notes on a staff member, without building Note objects"""
+        staff = self._fresh_staff().get(staff_id)
+        return len(staff.notes) if staff else 0
+    
+    def count_active_goals_for_staff(self, staff_id: str) -> int:
+        """Number of a staff member's goals with status 'active'"""
+        staff = self._fresh_staff().get(staff_id)
+        if not staff:
+            return 0
+        return sum(1 for goal in self._storage.get_goals_for_staff_obj(staff) if goal.status == "active")
+    
+    def get_all_reminders(self) -> List[Reminder]:
+        """Get all reminders"""
+        self._fresh_reminders()
+        return [reminder.model_copy(deep=True) for reminder in self._reminders]
+    
+    def get_reminders(self, status: Optional[str] = None, staff_id: Optional[str] = None) -> List[Reminder]:
+        """Get reminders, optionally filtered by status and/or staff member"""
+        self._fresh_reminders()
+        if status is None and staff_id is None:
+            matches = self._reminders
+        elif staff_id is None:
+            matches = self._reminders_by_status.get(status, [])
+        elif status is None:
+            matches = self._reminders_by_staff.get(staff_id, [])
+        else:
+            # Walk the shorter index and check the other condition; both keep file order
+            by_status = self._reminders_by_status.get(status, [])
+            by_staff = self._reminders_by_staff.get(staff_id, [])
+            if len(by_status) <= len(by_staff):
+                matches = [r for r in by_status if r.staff_id == staff_id]
+            else:
+                matches = [r for r in by_staff if r.status.value == status]
+        return [reminder.model_copy(deep=True) for reminder in matches]
+    
+    def get_reminder_by_id(self, reminder_id: str) -> Optional[Reminder]:
+        """Get a reminder by ID"""
+        reminder = self._fresh_reminders().get(reminder_id)
+        return reminder.model_copy(deep=True) if reminder else None
+    
+    # Writes go to disk first, then drop whatever they may have changed
+    
+    def save_staff(self, staff: StaffMember):
+        """Save staff member"""
+        self._storage.save_staff(staff)
+        self._invalidate_staff()
+    
+    def delete_staff(self, staff_id: str) -> bool:
+        """Delete staff member"""
+        deleted = self._storage.delete_staff(staff_id)
+        self._invalidate_staff()
+        return deleted
+    
+    def add_note_to_staff(self, staff_id: str, note_content: str, category: str = None, source: str = None):
+        """Add a note to a staff member"""
+        self._storage.add_note_to_staff(staff_id, note_content, category, source)
+        self._invalidate_staff()
+    
+    def add_notes_bulk(self, notes: List[tuple]):
+        """Add (staff_id, content, category, source) notes"""
+        self._storage.add_notes_bulk(notes)
+        self._invalidate_staff()
+    
+    def save_goal(self, goal: Goal):
+        """Save/update a goal"""
+        self._storage.save_goal(goal)
+        self._invalidate_staff()
+    
+    def save_reminder_to_markdown(self, reminder: Reminder):
+        """Add a reminder"""
+        self._storage.save_reminder_to_markdown(reminder)
+        self._invalidate_reminders()
+    
+    def complete_reminder(self, reminder: Reminder):
+        """Move a reminder to the completed section"""
+        self._storage.complete_reminder(reminder)
+        self._invalidate_reminders()
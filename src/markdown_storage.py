@@ -1,11 +1,116 @@
+import json
 import os
 import re
 import uuid
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import yaml
-from .models import StaffMember, Note, Reminder, Goal, CallTranscript
+from .models import StaffMember, Note, Reminder, Goal, CallTranscript, Priority, ReminderStatus
+
+# Prefer libyaml's C loader/dumper when available
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+_RE_NONWORD = re.compile(r'[^\w\s-]')
+_RE_DASHES = re.compile(r'[-\s]+')
+_RE_MULTIDASH = re.compile(r'-{2,}')
+_RE_DUE = re.compile(r'- ([🟢🟡🔴🚨⚪]) \*\*(.*?)\*\* \(Due: ([\d-]+)\)')
+_RE_COMPLETED = re.compile(r'- ✅ \*\*(.*?)\*\* \(Completed: ([\d-]+)\)')
+_RE_BACKTICK_ID = re.compile(r'`([^`]+)`')
+_RE_NOTE_TS = re.compile(r'\*\(.*?(\d{4}-\d{2}-\d{2} \d{2}:\d{2}).*?\)\*')
+_RE_NOTE_CAT = re.compile(r'\*\((.*?),')
+_RE_NOTE_TRAILER = re.compile(r'\s*\*\(.*?\)\*\s*$')
+_RE_UPDATED_AT = re.compile(r'^updated_at: .*$', re.MULTILINE)
+_RE_SECTION_BREAK = re.compile(r'^[ \t]*## ', re.MULTILINE)
+_RE_LAST_UPDATED = re.compile(r'^\*Last updated: .*\*$', re.MULTILINE)
+
+# ASCII fast path for _sanitize_filename: drop punctuation, lowercase letters,
+# and turn whitespace into hyphens in a single str.translate pass
+_SANITIZE_TABLE = {}
+for _c in range(128):
+    _ch = chr(_c)
+    if _ch.isalnum() or _ch == '_':
+        if _ch.isupper():
+            _SANITIZE_TABLE[_c] = _ch.lower()
+    elif _ch == '-' or _ch.isspace():
+        _SANITIZE_TABLE[_c] = '-'
+    else:
+        _SANITIZE_TABLE[_c] = None
+del _c, _ch
+
+# Below this many staff files to parse, reading them in turn beats handing them to threads
+_PARALLEL_PARSE_MIN = 8
+
+# List items starting with these are placeholders, not content
+_PLACEHOLDER_PREFIXES = ("No ", "*")
+
+# Staff markdown section headers and the StaffMember list field each fills
+_STAFF_SECTIONS = {
+    "## Skills": "skills",
+    "## Current Goals": "goals",
+    "## Notes": "notes",
+    "## Achievements": "achievements",
+    "## Concerns": "concerns",
+}
+
+# Reminder priority <-> emoji marker used in reminders.md
+_PRIORITY_EMOJI = {"low": "🟢", "medium": "🟡", "high": "🔴", "urgent": "🚨"}
+_PRIORITY_BY_EMOJI = {
+    "🟢": Priority.LOW,
+    "🟡": Priority.MEDIUM,
+    "🔴": Priority.HIGH,
+    "🚨": Priority.URGENT,
+    "⚪": Priority.MEDIUM,
+}
+
+_STAFF_TEMPLATE = """---
+{frontmatter}---
+
+# {name}
+
+## Overview
+- **Role:** {role}
+- **Department:** {department}
+- **Email:** {email}
+- **Manager:** {manager}
+
+## Skills
+{skills}
+
+## Current Goals
+{goals}
+
+## Notes
+{notes}
+
+## Achievements
+{achievements}
+
+## Concerns
+{concerns}
+
+---
+*Last updated: {updated}*
+"""
+
+def _fmt_bullets(items: List[str], empty_msg: str) -> str:
+    """Render items as a markdown bullet list, or a placeholder bullet if empty"""
+    return "- " + "\n- ".join(items) if items else f"- {empty_msg}"
+
+def _as_datetime(value: Any) -> Optional[datetime]:
+    """Coerce a frontmatter value to datetime; YAML may already have parsed it"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.fromisoformat(value)
 
 class MarkdownStorage:
     def __init__(self, data_dir: str = "data"):
@@ -13,6 +118,7 @@ class MarkdownStorage:
         self.staff_dir = self.data_dir / "staff"
         self.reminders_file = self.data_dir / "reminders.md"
         self.transcripts_dir = self.data_dir / "transcripts"
+        self.index_file = self.data_dir / "staff_index.json"
         
         # Create directories
         self.staff_dir.mkdir(parents=True, exist_ok=True)
@@ -21,6 +127,105 @@ class MarkdownStorage:
         # Initialize reminders file if not exists
         if not self.reminders_file.exists():
             self._create_reminders_file()
+        
+        # Parsed staff files keyed by path, invalidated by (mtime, size)
+        self._staff_cache: Dict[str, tuple[tuple[int, int], StaffMember]] = {}
+        # Pool for parsing many uncached staff files at once, started on first need
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Load id -> filename index, rebuilding it from the staff files if missing
+        self._id_to_file: Dict[str, str] = {}
+        self._name_to_id: Dict[str, str] = {}
+        # Index file contents as last read or written, so unchanged indexes aren't rewritten
+        self._index_text: Optional[str] = None
+        # Staff directory mtime as of the last rebuild, and each indexed file's mtime then;
+        # a miss rescans only when one of these has moved
+        self._index_stamp: Optional[int] = None
+        self._index_mtimes: Dict[str, int] = {}
+        if not self._load_index():
+            self._rebuild_index()
+    
+    def _load_index(self) -> bool:
+        """Load the staff index from disk, returning False if unavailable"""
+        try:
+            text = self.index_file.read_text(encoding='utf-8')
+            data = json.loads(text)
+            self._id_to_file = dict(data['ids'])
+            self._name_to_id = dict(data['names'])
+            self._index_text = text
+            return True
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+    
+    def _write_index(self):
+        """Atomically write the staff index to disk, unless it already holds these contents"""
+        text = json.dumps({'ids': self._id_to_file, 'names': self._name_to_id}, indent=2)
+        if text != self._index_text:
+            self._atomic_write_text(self.index_file, text)
+            self._index_text = text
+    
+    def _iter_staff_files(self):
+        """Yield a DirEntry for each staff markdown file"""
+        with os.scandir(self.staff_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.md') and entry.is_file(follow_symlinks=False):
+                    yield entry
+    
+    def _staff_dir_mtime(self) -> int:
+        return os.stat(self.staff_dir).st_mtime_ns
+    
+    @contextmanager
+    def _own_staff_write(self, file_path: Path):
+        """Wrap a write to file_path that keeps the index current, so it isn't taken for an outside change"""
+        current = self._index_stamp is not None and self._index_stamp == self._staff_dir_mtime()
+        yield
+        if current:
+            self._index_stamp = self._staff_dir_mtime()
+        try:
+            self._index_mtimes[file_path.name] = file_path.stat().st_mtime_ns
+        except OSError:
+            self._index_mtimes.pop(file_path.name, None)
+    
+    def _indexed_file_changed(self, staff_id: str) -> bool:
+        """Whether the file indexed for staff_id was edited or removed since the last rebuild"""
+        filename = self._id_to_file.get(staff_id)
+        if not filename:
+            return False
+        try:
+            mtime = os.stat(self.staff_dir / filename).st_mtime_ns
+        except OSError:
+            return True
+        return mtime != self._index_mtimes.get(filename)
+    
+    def _rebuild_index(self, staff_id: Optional[str] = None):
+        """Rebuild the staff index by scanning every staff file once, unless nothing changed since the last rebuild"""
+        stamp = self._staff_dir_mtime()
+        if stamp == self._index_stamp and not (staff_id and self._indexed_file_changed(staff_id)):
+            return
+        self._index_stamp = stamp
+        self._id_to_file = {}
+        self._name_to_id = {}
+        self._index_mtimes = {}
+        for entry in self._iter_staff_files():
+            try:
+                mtime = entry.stat().st_mtime_ns
+                metadata = self._read_frontmatter(Path(entry.path))
+            except OSError:
+                continue
+            if metadata.get('id'):
+                self._id_to_file[metadata['id']] = entry.name
+                self._index_mtimes[entry.name] = mtime
+                if metadata.get('name'):
+                    self._name_to_id[metadata['name']] = metadata['id']
+        self._write_index()
+    
+    def _atomic_write_text(self, path: Path, content: str):
+        """Write UTF-8 text to a temp file and atomically swap it into place"""
+        data = content.encode('utf-8')
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb', buffering=1 << 16) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
     
     def _create_reminders_file(self):
         """Create initial reminders markdown file"""
@@ -34,13 +239,17 @@ class MarkdownStorage:
 
 <!-- Completed tasks will be moved here -->
 """
-        self.reminders_file.write_text(content)
+        self._atomic_write_text(self.reminders_file, content)
     
     def _sanitize_filename(self, name: str) -> str:
         """Convert name to safe filename"""
+        if name.isascii():
+            safe_name = _RE_MULTIDASH.sub('-', name.translate(_SANITIZE_TABLE))
+            return safe_name.strip('-')
+        
         # Remove special characters, replace spaces with hyphens
-        safe_name = re.sub(r'[^\w\s-]', '', name)
-        safe_name = re.sub(r'[-\s]+', '-', safe_name)
+        safe_name = _RE_NONWORD.sub('', name)
+        safe_name = _RE_DASHES.sub('-', safe_name)
         return safe_name.lower().strip('-')
     
     def _parse_frontmatter(self, content: str) -> tuple[Dict, str]:
@@ -56,102 +265,184 @@ class MarkdownStorage:
             frontmatter = content[4:end_marker]
             body = content[end_marker + 5:]
             
-            metadata = yaml.safe_load(frontmatter) or {}
+            metadata = yaml.load(frontmatter, Loader=SafeLoader) or {}
             return metadata, body
         except:
             return {}, content
     
-    def _create_staff_markdown(self, staff: StaffMember) -> str:
+    def _create_staff_markdown(self, staff: StaffMember, now: Optional[datetime] = None) -> str:
         """Generate markdown content for a staff member"""
-        metadata = {
-            'id': staff.id,
-            'name': staff.name,
-            'email': staff.email,
-            'role': staff.role,
-            'department': staff.department,
-            'hire_date': staff.hire_date.isoformat() if staff.hire_date else None,
-            'manager': staff.manager,
-            'last_one_on_one': staff.last_one_on_one.isoformat() if staff.last_one_on_one else None,
-            'next_review': staff.next_review.isoformat() if staff.next_review else None,
-            'created_at': staff.created_at.isoformat(),
-            'updated_at': staff.updated_at.isoformat(),
-        }
-        
-        # Remove None values
-        metadata = {k: v for k, v in metadata.items() if v is not None}
-        
-        content = f"""---
-{yaml.dump(metadata, default_flow_style=False)}---
-
-# {staff.name}
-
-## Overview
-- **Role:** {staff.role or 'Not specified'}
-- **Department:** {staff.department or 'Not specified'}
-- **Email:** {staff.email or 'Not specified'}
-- **Manager:** {staff.manager or 'Not specified'}
-
-## Skills
-{chr(10).join(f'- {skill}' for skill in staff.skills) if staff.skills else '- No skills listed yet'}
-
-## Current Goals
-{chr(10).join(f'- {goal}' for goal in staff.goals) if staff.goals else '- No current goals'}
-
-## Notes
-{chr(10).join(f'- {note}' for note in staff.notes) if staff.notes else '- No notes yet'}
-
-## Achievements
-{chr(10).join(f'- {achievement}' for achievement in staff.achievements) if staff.achievements else '- No achievements recorded yet'}
-
-## Concerns
-{chr(10).join(f'- {concern}' for concern in staff.concerns) if staff.concerns else '- No concerns noted'}
-
----
-*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*
-"""
+        now = now or datetime.now()
+        # Build the frontmatter dict in one pass, skipping None values. Datetimes
+        # are dumped as YAML timestamps so the loader hands them back as datetime
+        metadata = {k: v for k, v in (
+            ('id', staff.id),
+            ('name', staff.name),
+            ('email', staff.email),
+            ('role', staff.role),
+            ('department', staff.department),
+            ('hire_date', staff.hire_date),
+            ('manager', staff.manager),
+            ('last_one_on_one', staff.last_one_on_one),
+            ('next_review', staff.next_review),
+            ('created_at', staff.created_at),
+            ('updated_at', staff.updated_at),
+        ) if v is not None}
+        
+        content = _STAFF_TEMPLATE.format(
+            frontmatter=yaml.dump(metadata, Dumper=SafeDumper, default_flow_style=False, sort_keys=False, allow_unicode=True),
+            name=staff.name,
+            role=staff.role or 'Not specified',
+            department=staff.department or 'Not specified',
+            email=staff.email or 'Not specified',
+            manager=staff.manager or 'Not specified',
+            skills=_fmt_bullets(staff.skills, 'No skills listed yet'),
+            goals=_fmt_bullets(staff.goals, 'No current goals'),
+            notes=_fmt_bullets(staff.notes, 'No notes yet'),
+            achievements=_fmt_bullets(staff.achievements, 'No achievements recorded yet'),
+            concerns=_fmt_bullets(staff.concerns, 'No concerns noted'),
+            updated=now.strftime('%Y-%m-%d %H:%M'),
+        )
         return content
     
     def save_staff(self, staff: StaffMember):
         """Save staff member as markdown file"""
-        staff.updated_at = datetime.now()
+        now = datetime.now()
+        staff.updated_at = now
         filename = f"{self._sanitize_filename(staff.name)}.md"
         file_path = self.staff_dir / filename
         
-        content = self._create_staff_markdown(staff)
-        file_path.write_text(content)
+        content = self._create_staff_markdown(staff, now=now)
+        with self._own_staff_write(file_path):
+            self._atomic_write_text(file_path, content)
+            
+            # Remove the old file if the staff member was renamed
+            old_filename = self._id_to_file.get(staff.id)
+            if old_filename and old_filename != filename:
+                (self.staff_dir / old_filename).unlink(missing_ok=True)
+                self._staff_cache.pop(str(self.staff_dir / old_filename), None)
+                self._index_mtimes.pop(old_filename, None)
+        self._name_to_id = {n: i for n, i in self._name_to_id.items() if i != staff.id}
+        
+        self._id_to_file[staff.id] = filename
+        self._name_to_id[staff.name] = staff.id
+        self._write_index()
+        self._staff_cache.pop(str(file_path), None)
+    
+    def _load_staff_cached(self, file_path: Path) -> Optional[StaffMember]:
+        """Load a staff file, reusing the parsed result while its mtime and size are unchanged"""
+        key = str(file_path)
+        st = file_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._staff_cache.get(key)
+        if cached is None or cached[0] != stamp:
+            staff = self._markdown_to_staff(file_path.read_text(encoding='utf-8'))
+            if staff is None:
+                self._staff_cache.pop(key, None)
+                return None
+            cached = (stamp, staff)
+            self._staff_cache[key] = cached
+        # Callers mutate the returned model, so hand out a copy
+        return cached[1].model_copy(deep=True)
+    
+    def _read_indexed_staff(self, staff_id: str) -> Optional[StaffMember]:
+        """Read a staff member via the index, or None if the entry is missing or stale"""
+        filename = self._id_to_file.get(staff_id)
+        if not filename:
+            return None
+        try:
+            staff = self._load_staff_cached(self.staff_dir / filename)
+        except OSError:
+            return None
+        if staff and staff.id == staff_id:
+            return staff
+        return None
     
     def get_staff_by_id(self, staff_id: str) -> Optional[StaffMember]:
         """Get staff member by ID"""
-        for file_path in self.staff_dir.glob("*.md"):
-            content = file_path.read_text()
-            metadata, _ = self._parse_frontmatter(content)
-            
-            if metadata.get('id') == staff_id:
-                return self._markdown_to_staff(content)
+        staff = self._read_indexed_staff(staff_id)
+        if staff is None:
+            # Files may have been added or edited by hand; rescan once and retry
+            self._rebuild_index(staff_id)
+            staff = self._read_indexed_staff(staff_id)
+        return staff
+    
+    def _read_frontmatter(self, file_path: Path) -> Dict:
+        """Parse only the YAML frontmatter of a file, reading no further than its end"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read(4096)
+            if not content.startswith('---\n'):
+                return {}
+            while content.find('\n---\n', 3) == -1:
+                chunk = f.read(4096)
+                if not chunk:
+                    break
+                content += chunk
+        metadata, _ = self._parse_frontmatter(content)
+        return metadata
+    
+    def _read_indexed_meta(self, staff_id: str) -> Optional[Dict]:
+        """Read a staff member's frontmatter via the index, or None if missing or stale"""
+        filename = self._id_to_file.get(staff_id)
+        if not filename:
+            return None
+        try:
+            metadata = self._read_frontmatter(self.staff_dir / filename)
+        except OSError:
+            return None
+        if metadata.get('id') == staff_id:
+            return metadata
         return None
     
+    def _get_staff_meta_by_id(self, staff_id: str) -> Optional[Dict]:
+        """Get a staff member's frontmatter metadata without parsing the body"""
+        metadata = self._read_indexed_meta(staff_id)
+        if metadata is None:
+            self._rebuild_index(staff_id)
+            metadata = self._read_indexed_meta(staff_id)
+        return metadata
+    
     def get_staff_by_name(self, name: str) -> Optional[StaffMember]:
         """Get staff member by name"""
         filename = f"{self._sanitize_filename(name)}.md"
         file_path = self.staff_dir / filename
         
         if file_path.exists():
-            content = file_path.read_text()
-            return self._markdown_to_staff(content)
+            return self._load_staff_cached(file_path)
         return None
     
+    def _try_load_staff(self, file_path: Path) -> Optional[StaffMember]:
+        """Load a staff file, logging and skipping it on error"""
+        try:
+            return self._load_staff_cached(file_path)
+        except Exception as e:
+            print(f"Error reading {file_path}: {e}")
+            return None
+    
     def get_all_staff(self) -> List[StaffMember]:
         """Get all staff members"""
-        staff_list = []
-        for file_path in self.staff_dir.glob("*.md"):
+        paths = []
+        uncached = 0
+        for entry in self._iter_staff_files():
+            path = Path(entry.path)
+            paths.append(path)
+            cached = self._staff_cache.get(str(path))
             try:
-                content = file_path.read_text()
-                staff = self._markdown_to_staff(content)
-                if staff:
-                    staff_list.append(staff)
-            except Exception as e:
-                print(f"Error reading {file_path}: {e}")
-        return staff_list
+                st = entry.stat()
+            except OSError:
+                continue
+            if cached is None or cached[0] != (st.st_mtime_ns, st.st_size):
+                uncached += 1
+        
+        if uncached < _PARALLEL_PARSE_MIN:
+            # Mostly cache hits: each load is a stat and a copy, not worth a thread
+            loaded = map(self._try_load_staff, paths)
+        else:
+            # Overlap file reads across a reused thread pool; results keep directory order
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor()
+            loaded = self._executor.map(self._try_load_staff, paths)
+        return [staff for staff in loaded if staff]
     
     def _markdown_to_staff(self, content: str) -> Optional[StaffMember]:
         """Convert markdown content to StaffMember object"""
@@ -161,12 +452,9 @@ class MarkdownStorage:
             return None
         
         # Parse lists from markdown body
-        skills = self._extract_list_from_section(body, "## Skills")
-        goals = self._extract_list_from_section(body, "## Current Goals") 
-        notes = self._extract_list_from_section(body, "## Notes")
-        achievements = self._extract_list_from_section(body, "## Achievements")
-        concerns = self._extract_list_from_section(body, "## Concerns")
+        sections = self._extract_staff_sections(body)
         
+        # Staff files may be edited by hand, so validate: a bad file is logged and skipped
         try:
             return StaffMember(
                 id=metadata['id'],
@@ -174,176 +462,270 @@ class MarkdownStorage:
                 email=metadata.get('email'),
                 role=metadata.get('role'),
                 department=metadata.get('department'),
-                hire_date=datetime.fromisoformat(metadata['hire_date']) if metadata.get('hire_date') else None,
+                hire_date=_as_datetime(metadata.get('hire_date')),
                 manager=metadata.get('manager'),
-                last_one_on_one=datetime.fromisoformat(metadata['last_one_on_one']) if metadata.get('last_one_on_one') else None,
-                next_review=datetime.fromisoformat(metadata['next_review']) if metadata.get('next_review') else None,
-                created_at=datetime.fromisoformat(metadata['created_at']),
-                updated_at=datetime.fromisoformat(metadata['updated_at']),
-                skills=skills,
-                goals=goals,
-                notes=notes,
-                achievements=achievements,
-                concerns=concerns
+                last_one_on_one=_as_datetime(metadata.get('last_one_on_one')),
+                next_review=_as_datetime(metadata.get('next_review')),
+                created_at=_as_datetime(metadata['created_at']),
+                updated_at=_as_datetime(metadata['updated_at']),
+                **sections
             )
         except Exception as e:
             print(f"Error parsing staff member: {e}")
             return None
     
-    def _extract_list_from_section(self, content: str, section_header: str) -> List[str]:
-        """Extract list items from a markdown section"""
-        items = []
-        lines = content.split('\n')
-        in_section = False
-        
-        for line in lines:
-            if line.strip() == section_header:
-                in_section = True
-                continue
-            elif line.startswith('## ') and in_section:
-                break
-            elif in_section and line.strip().startswith('- '):
-                item = line.strip()[2:].strip()
-                if item and not item.startswith('No ') and not item.startswith('*'):
-                    items.append(item)
-        
-        return items
+    def _extract_staff_sections(self, body: str) -> Dict[str, List[str]]:
+        """Extract list items from every staff section in a single pass"""
+        sections = {field: [] for field in _STAFF_SECTIONS.values()}
+        current = None
+        
+        for line in body.split('\n'):
+            stripped = line.strip()
+            if stripped in _STAFF_SECTIONS:
+                current = sections[_STAFF_SECTIONS[stripped]]
+            elif line.startswith('## '):
+                current = None
+            elif current is not None and stripped.startswith('- '):
+                item = stripped[2:].strip()
+                if item and not item.startswith(_PLACEHOLDER_PREFIXES):
+                    current.append(item)
+        
+        return sections
     
     def delete_staff(self, staff_id: str) -> bool:
         """Delete staff member"""
-        staff = self.get_staff_by_id(staff_id)
-        if staff:
-            filename = f"{self._sanitize_filename(staff.name)}.md"
-            file_path = self.staff_dir / filename
-            if file_path.exists():
+        if staff_id not in self._id_to_file:
+            self._rebuild_index(staff_id)
+        filename = self._id_to_file.pop(staff_id, None)
+        if not filename:
+            return False
+        
+        self._name_to_id = {n: i for n, i in self._name_to_id.items() if i != staff_id}
+        self._write_index()
+        
+        file_path = self.staff_dir / filename
+        self._staff_cache.pop(str(file_path), None)
+        if file_path.exists():
+            with self._own_staff_write(file_path):
                 file_path.unlink()
-                return True
+            return True
         return False
     
+    def _format_note(self, note_content: str, category: Optional[str], source: Optional[str], timestamp: str) -> str:
+        """Render a note with its category/source/timestamp trailer"""
+        note_with_meta = f"{note_content}"
+        if category or source:
+            note_with_meta += f" *({category or 'general'}"
+            if source:
+                note_with_meta += f", from {source}"
+            note_with_meta += f", {timestamp})*"
+        else:
+            note_with_meta += f" *({timestamp})*"
+        return note_with_meta
+    
     def add_note_to_staff(self, staff_id: str, note_content: str, category: str = None, source: str = None):
         """Add a note to staff member's markdown file"""
-        staff = self.get_staff_by_id(staff_id)
-        if staff:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
-            note_with_meta = f"{note_content}"
-            if category or source:
-                note_with_meta += f" *({category or 'general'}"
-                if source:
-                    note_with_meta += f", from {source}"
-                note_with_meta += f", {timestamp})*"
-            else:
-                note_with_meta += f" *({timestamp})*"
+        self.add_notes_bulk([(staff_id, note_content, category, source)])
+    
+    def add_notes_bulk(self, notes: List[tuple]):
+        """Add (staff_id, content, category, source) notes, writing each staff file once"""
+        now = datetime.now()
+        timestamp = now.strftime('%Y-%m-%d %H:%M')
+        notes_by_staff: Dict[str, List[str]] = {}
+        for staff_id, note_content, category, source in notes:
+            notes_by_staff.setdefault(staff_id, []).append(
+                self._format_note(note_content, category, source, timestamp)
+            )
+        
+        for staff_id, staff_notes in notes_by_staff.items():
+            # Only the Notes section changes, so patch it in place when possible
+            if self._append_staff_notes(staff_id, staff_notes, now):
+                continue
             
-            staff.notes.append(note_with_meta)
-            self.save_staff(staff)
+            staff = self.get_staff_by_id(staff_id)
+            if staff:
+                staff.notes.extend(staff_notes)
+                self.save_staff(staff)
     
     def save_reminder_to_markdown(self, reminder: Reminder):
         """Add reminder to markdown file"""
         if not self.reminders_file.exists():
             self._create_reminders_file()
         
-        content = self.reminders_file.read_text()
+        content = self.reminders_file.read_text(encoding='utf-8')
         
         # Format reminder
-        priority_emoji = {"low": "🟢", "medium": "🟡", "high": "🔴", "urgent": "🚨"}
-        emoji = priority_emoji.get(reminder.priority.value, "⚪")
+        emoji = _PRIORITY_EMOJI.get(reminder.priority.value, "⚪")
         
         reminder_line = f"- {emoji} **{reminder.title}** (Due: {reminder.due_date.strftime('%Y-%m-%d')})"
         if reminder.description:
             reminder_line += f"\n  - {reminder.description}"
         if reminder.staff_id:
-            staff = self.get_staff_by_id(reminder.staff_id)
-            if staff:
-                reminder_line += f"\n  - Related to: {staff.name}"
+            staff_meta = self._get_staff_meta_by_id(reminder.staff_id)
+            if staff_meta and staff_meta.get('name'):
+                reminder_line += f"\n  - Related to: {staff_meta['name']}"
         reminder_line += f"\n  - ID: `{reminder.id}`\n"
         
         # Add to pending section
-        lines = content.split('\n')
-        pending_index = -1
-        for i, line in enumerate(lines):
-            if line.strip() == "## Pending Tasks":
-                pending_index = i
+        new_content = self._insert_into_section(content, "## Pending Tasks", reminder_line)
+        if new_content is not None:
+            self._atomic_write_text(self.reminders_file, new_content)
+    
+    def _find_header_line(self, content: str, section_header: str) -> int:
+        """Return the end offset of the line that strips to section_header, or -1"""
+        pos = content.find(section_header)
+        while pos != -1:
+            line_start = content.rfind('\n', 0, pos) + 1
+            line_end = content.find('\n', pos)
+            if line_end == -1:
+                line_end = len(content)
+            if content[line_start:line_end].strip() == section_header:
+                return line_end
+            pos = content.find(section_header, pos + 1)
+        return -1
+    
+    def _append_to_section(self, content: str, section_header: str, bullets: List[str]) -> Optional[str]:
+        """Append bullets to the end of a section, dropping any placeholder bullet"""
+        line_end = self._find_header_line(content, section_header)
+        if line_end == -1:
+            return None
+        
+        section_end = content.find('\n## ', line_end)
+        if section_end == -1:
+            section_end = len(content)
+        section = content[line_end:section_end]
+        items = section.rstrip()
+        trailing = section[len(items):]
+        
+        lines = [
+            line for line in items.split('\n')
+            if not (line.strip().startswith('- ') and line.strip()[2:].strip().startswith(_PLACEHOLDER_PREFIXES))
+        ]
+        lines.extend(f"- {bullet}" for bullet in bullets)
+        return content[:line_end] + '\n'.join(lines) + trailing + content[section_end:]
+    
+    def _append_staff_notes(self, staff_id: str, notes: List[str], now: datetime) -> bool:
+        """Patch notes into the staff file's Notes section without re-rendering it"""
+        filename = self._id_to_file.get(staff_id)
+        if not filename:
+            return False
+        file_path = self.staff_dir / filename
+        try:
+            content = file_path.read_text(encoding='utf-8')
+        except OSError:
+            return False
+        
+        metadata, body = self._parse_frontmatter(content)
+        if metadata.get('id') != staff_id:
+            return False
+        new_body = self._append_to_section(body, "## Notes", notes)
+        if new_body is None:
+            return False
+        
+        # Bump updated_at in the frontmatter and the footer
+        frontmatter = content[:len(content) - len(body)]
+        updated_line = yaml.dump({'updated_at': now}, Dumper=SafeDumper).rstrip('\n')
+        frontmatter = _RE_UPDATED_AT.sub(lambda _: updated_line, frontmatter, count=1)
+        new_body = _RE_LAST_UPDATED.sub(lambda _: f"*Last updated: {now.strftime('%Y-%m-%d %H:%M')}*", new_body, count=1)
+        
+        with self._own_staff_write(file_path):
+            self._atomic_write_text(file_path, frontmatter + new_body)
+        self._staff_cache.pop(str(file_path), None)
+        return True
+    
+    def _insert_into_section(self, content: str, section_header: str, block: str) -> Optional[str]:
+        """Insert a block after a section header and its blank/comment lines"""
+        line_end = self._find_header_line(content, section_header)
+        if line_end == -1:
+            return None
+        
+        # Skip blank lines and HTML comments following the header
+        insert_at = line_end + 1
+        while insert_at <= len(content):
+            next_end = content.find('\n', insert_at)
+            line = content[insert_at:next_end if next_end != -1 else None].strip()
+            if line and not line.startswith("<!--"):
+                return content[:insert_at] + block + '\n' + content[insert_at:]
+            if next_end == -1:
                 break
+            insert_at = next_end + 1
         
-        if pending_index != -1:
-            # Find insertion point (after the header and comment)
-            insert_index = pending_index + 1
-            while insert_index < len(lines) and (lines[insert_index].strip() == "" or lines[insert_index].strip().startswith("<!--")):
-                insert_index += 1
-            
-            lines.insert(insert_index, reminder_line)
-            self.reminders_file.write_text('\n'.join(lines))
+        return content + '\n' + block
     
     def get_all_reminders(self) -> List[Reminder]:
         """Parse all reminders from markdown file"""
-        reminders = []
         if not self.reminders_file.exists():
-            return reminders
-        
-        content = self.reminders_file.read_text()
-        lines = content.split('\n')
+            return []
         
+        content = self.reminders_file.read_text(encoding='utf-8')
+        
+        # Only the Pending and Completed sections hold reminders; walk them in file order
+        sections = []
+        for header in ("## Pending Tasks", "## Completed Tasks"):
+            line_end = self._find_header_line(content, header)
+            if line_end != -1:
+                next_section = _RE_SECTION_BREAK.search(content, line_end)
+                sections.append((line_end, content[line_end:next_section.start() if next_section else len(content)]))
+        sections.sort()
+        
+        # "Related to:" lookups, seeded from the index and memoized for this pass
+        name_to_id = dict(self._name_to_id)
+        parsed = []
+        for _, section in sections:
+            parsed.extend(self._parse_reminder_section(section, name_to_id))
+        
+        # Fields come from our own parser, so skip pydantic validation
+        for fields in parsed:
+            fields['id'] = fields['id'] or str(uuid.uuid4())
+        return [Reminder.model_construct(**fields) for fields in parsed]
+    
+    def _parse_reminder_section(self, section: str, name_to_id: Dict[str, Optional[str]]) -> List[Dict[str, Any]]:
+        """Parse the reminder entries in one section of the reminders file"""
+        parsed = []
         current_reminder = None
-        in_pending = False
-        in_completed = False
         
-        for line in lines:
-            line = line.strip()
+        for raw_line in section.split('\n'):
+            line = raw_line.strip()
             
-            if line == "## Pending Tasks":
-                in_pending = True
-                in_completed = False
-                continue
-            elif line == "## Completed Tasks":
-                in_pending = False
-                in_completed = True
-                continue
-            elif line.startswith("## "):
-                in_pending = False
-                in_completed = False
-                continue
+            # Parse description and metadata (indented under the reminder line)
+            if current_reminder and raw_line.startswith("  - "):
+                detail = raw_line[4:].strip()
+                if detail.startswith("Related to:"):
+                    # Find staff by name
+                    name = detail.replace("Related to:", "").strip()
+                    if name not in name_to_id:
+                        staff = self.get_staff_by_name(name)
+                        name_to_id[name] = staff.id if staff else None
+                    if name_to_id[name]:
+                        current_reminder['staff_id'] = name_to_id[name]
+                elif detail.startswith("ID:"):
+                    # Extract ID from backticks
+                    id_match = _RE_BACKTICK_ID.search(detail)
+                    if id_match:
+                        current_reminder['id'] = id_match.group(1)
+                else:
+                    current_reminder['description'] = detail
             
             # Parse reminder line
-            if (in_pending or in_completed) and line.startswith("- ") and "**" in line:
+            elif line.startswith("- ") and "**" in line:
                 # Finalize previous reminder first
                 if current_reminder:
-                    try:
-                        from .models import Priority, ReminderStatus
-                        import uuid as uuid_module
-                        reminder = Reminder(
-                            id=current_reminder['id'] or str(uuid_module.uuid4()),
-                            title=current_reminder['title'],
-                            description=current_reminder['description'],
-                            due_date=current_reminder['due_date'],
-                            priority=Priority(current_reminder['priority']),
-                            status=ReminderStatus(current_reminder['status']),
-                            staff_id=current_reminder['staff_id']
-                        )
-                        reminders.append(reminder)
-                    except Exception as e:
-                        print(f"Error parsing previous reminder: {e}")
+                    parsed.append(current_reminder)
+                    current_reminder = None
                 
                 # Parse: - 🔴 **Title** (Due: 2024-06-15) or - ✅ **Title** (Completed: 2024-06-15)
-                import re
-                due_match = re.search(r'- [🟢🟡🔴🚨⚪] \*\*(.*?)\*\* \(Due: ([\d-]+)\)', line)
-                completed_match = re.search(r'- ✅ \*\*(.*?)\*\* \(Completed: ([\d-]+)\)', line)
+                due_match = _RE_DUE.search(line)
+                completed_match = _RE_COMPLETED.search(line)
                 
                 if due_match:
-                    title = due_match.group(1)
-                    due_date_str = due_match.group(2)
-                    
-                    # Map emoji to priority
-                    priority_map = {"🟢": "low", "🟡": "medium", "🔴": "high", "🚨": "urgent", "⚪": "medium"}
-                    emoji = line.split()[1] if len(line.split()) > 1 else "⚪"
-                    priority = priority_map.get(emoji, "medium")
+                    emoji, title, due_date_str = due_match.groups()
                     
                     try:
-                        due_date = datetime.strptime(due_date_str, '%Y-%m-%d')
                         current_reminder = {
                             'title': title,
-                            'due_date': due_date,
-                            'priority': priority,
-                            'status': 'pending',
+                            'due_date': datetime.strptime(due_date_str, '%Y-%m-%d'),
+                            'priority': _PRIORITY_BY_EMOJI[emoji],
+                            'status': ReminderStatus.PENDING,
                             'description': '',
                             'staff_id': None,
                             'id': None
@@ -351,16 +733,14 @@ class MarkdownStorage:
                     except ValueError:
                         continue
                 elif completed_match:
-                    title = completed_match.group(1)
-                    completed_date_str = completed_match.group(2)
+                    title, completed_date_str = completed_match.groups()
                     
                     try:
-                        completed_date = datetime.strptime(completed_date_str, '%Y-%m-%d')
                         current_reminder = {
                             'title': title,
-                            'due_date': completed_date,  # Use completed date as due date
-                            'priority': 'medium',
-                            'status': 'completed',
+                            'due_date': datetime.strptime(completed_date_str, '%Y-%m-%d'),  # Use completed date as due date
+                            'priority': Priority.MEDIUM,
+                            'status': ReminderStatus.COMPLETED,
                             'description': '',
                             'staff_id': None,
                             'id': None
@@ -368,118 +748,66 @@ class MarkdownStorage:
                     except ValueError:
                         continue
             
-            # Parse description and metadata
-            elif current_reminder and line.startswith("  - "):
-                detail = line[4:].strip()
-                if detail.startswith("Related to:"):
-                    # Find staff by name
-                    name = detail.replace("Related to:", "").strip()
-                    staff = self.get_staff_by_name(name)
-                    if staff:
-                        current_reminder['staff_id'] = staff.id
-                elif detail.startswith("ID:"):
-                    # Extract ID from backticks
-                    id_match = re.search(r'`([^`]+)`', detail)
-                    if id_match:
-                        current_reminder['id'] = id_match.group(1)
-                else:
-                    current_reminder['description'] = detail
-            
             # Empty line or end of reminder - do nothing, we handle completion in the main parse loop
         
-        # Handle last reminder if file doesn't end with empty line
+        # Handle last reminder in the section
         if current_reminder:
-            try:
-                from .models import Priority, ReminderStatus
-                import uuid as uuid_module
-                reminder = Reminder(
-                    id=current_reminder['id'] or str(uuid_module.uuid4()),
-                    title=current_reminder['title'],
-                    description=current_reminder['description'],
-                    due_date=current_reminder['due_date'],
-                    priority=Priority(current_reminder['priority']),
-                    status=ReminderStatus(current_reminder['status']),
-                    staff_id=current_reminder['staff_id']
-                )
-                reminders.append(reminder)
-            except Exception as e:
-                print(f"Error parsing final reminder: {e}")
-        
-        return reminders
+            parsed.append(current_reminder)
+        
+        return parsed
     
     def complete_reminder(self, reminder: Reminder):
         """Move reminder from pending to completed section"""
         if not self.reminders_file.exists():
             return
         
-        content = self.reminders_file.read_text()
-        lines = content.split('\n')
+        content = self.reminders_file.read_text(encoding='utf-8')
         
-        # Find and remove the reminder from pending section
-        reminder_found = False
-        new_lines = []
-        skip_next_lines = 0
-        
-        for i, line in enumerate(lines):
-            if skip_next_lines > 0:
-                skip_next_lines -= 1
-                continue
-                
-            # Look for our reminder by ID
-            if f"ID: `{reminder.id}`" in line:
-                # Remove this line and the previous reminder lines
-                # Go back to find the start of this reminder
-                j = len(new_lines) - 1
-                while j >= 0 and not new_lines[j].strip().startswith("- "):
-                    j -= 1
-                if j >= 0:
-                    new_lines = new_lines[:j]  # Remove the reminder and its details
-                reminder_found = True
-                continue
-            else:
-                new_lines.append(line)
-        
-        if reminder_found:
-            # Add to completed section
-            completed_index = -1
-            for i, line in enumerate(new_lines):
-                if line.strip() == "## Completed Tasks":
-                    completed_index = i
-                    break
-            
-            if completed_index != -1:
-                # Create completed reminder entry
-                priority_emoji = {"low": "🟢", "medium": "🟡", "high": "🔴", "urgent": "🚨"}
-                emoji = priority_emoji.get(reminder.priority.value, "⚪")
-                
-                completed_line = f"- ✅ **{reminder.title}** (Completed: {datetime.now().strftime('%Y-%m-%d')})"
-                if reminder.description:
-                    completed_line += f"\n  - {reminder.description}"
-                if reminder.staff_id:
-                    staff = self.get_staff_by_id(reminder.staff_id)
-                    if staff:
-                        completed_line += f"\n  - Related to: {staff.name}"
-                completed_line += f"\n  - ID: `{reminder.id}`\n"
-                
-                # Insert after completed header
-                insert_index = completed_index + 1
-                while insert_index < len(new_lines) and (new_lines[insert_index].strip() == "" or new_lines[insert_index].strip().startswith("<!--")):
-                    insert_index += 1
-                
-                new_lines.insert(insert_index, completed_line)
-                self.reminders_file.write_text('\n'.join(new_lines))
+        # Find the reminder by ID and cut its whole block, from the top-level
+        # "- " line through the ID line and the blank line that follows it
+        id_pos = content.find(f"ID: `{reminder.id}`")
+        if id_pos == -1:
+            return
+        block_start = content.rfind('\n- ', 0, id_pos) + 1
+        if block_start == 0 and not content.startswith('- '):
+            return
+        block_end = content.find('\n', id_pos)
+        block_end = len(content) if block_end == -1 else block_end + 1
+        if content.startswith('\n', block_end):
+            block_end += 1
+        content = content[:block_start] + content[block_end:]
+        
+        # Create completed reminder entry
+        completed_line = f"- ✅ **{reminder.title}** (Completed: {datetime.now().strftime('%Y-%m-%d')})"
+        if reminder.description:
+            completed_line += f"\n  - {reminder.description}"
+        if reminder.staff_id:
+            staff_meta = self._get_staff_meta_by_id(reminder.staff_id)
+            if staff_meta and staff_meta.get('name'):
+                completed_line += f"\n  - Related to: {staff_meta['name']}"
+        completed_line += f"\n  - ID: `{reminder.id}`\n"
+        
+        # Add to completed section
+        new_content = self._insert_into_section(content, "## Completed Tasks", completed_line)
+        if new_content is not None:
+            self._atomic_write_text(self.reminders_file, new_content)
     
     def get_goals_for_staff(self, staff_id: str) -> List[Goal]:
         """Extract goals from staff member's markdown file"""
         staff = self.get_staff_by_id(staff_id)
         if not staff:
             return []
+        return self.get_goals_for_staff_obj(staff)
+    
+    def get_goals_for_staff_obj(self, staff: StaffMember) -> List[Goal]:
+        """Build Goal objects from an already-loaded staff member"""
+        staff_id = staff.id
         
         # For now, convert the simple goal strings to Goal objects
         # In a full implementation, we'd store goals with more metadata
         goals = []
         for i, goal_text in enumerate(staff.goals):
-            goal = Goal(
+            goal = Goal.model_construct(
                 id=f"{staff_id}-goal-{i}",
                 staff_id=staff_id,
                 title=goal_text,
@@ -611,20 +939,24 @@ class MarkdownStorage:
         
         content += f"\n---\n*Processed: {transcript.processed}*\n*ID: {transcript.id}*\n"
         
-        file_path.write_text(content)
+        self._atomic_write_text(file_path, content)
     
     def get_notes_for_staff(self, staff_id: str) -> List[Note]:
         """Get all notes for a staff member"""
         staff = self.get_staff_by_id(staff_id)
         if not staff:
             return []
+        return self.get_notes_for_staff_obj(staff)
+    
+    def get_notes_for_staff_obj(self, staff: StaffMember) -> List[Note]:
+        """Build Note objects from an already-loaded staff member, oldest first"""
+        staff_id = staff.id
         
         # Convert staff notes to Note objects
         notes = []
         for i, note_text in enumerate(staff.notes):
             # Parse timestamp and metadata from note text
-            import re
-            timestamp_match = re.search(r'\*\(.*?(\d{4}-\d{2}-\d{2} \d{2}:\d{2}).*?\)\*', note_text)
+            timestamp_match = _RE_NOTE_TS.search(note_text)
             if timestamp_match:
                 try:
                     timestamp = datetime.strptime(timestamp_match.group(1), '%Y-%m-%d %H:%M')
@@ -634,13 +966,13 @@ class MarkdownStorage:
                 timestamp = datetime.now()
             
             # Extract category
-            category_match = re.search(r'\*\((.*?),', note_text)
+            category_match = _RE_NOTE_CAT.search(note_text)
             category = category_match.group(1) if category_match else 'general'
             
             # Clean content
-            clean_content = re.sub(r'\s*\*\(.*?\)\*\s*$', '', note_text).strip()
+            clean_content = _RE_NOTE_TRAILER.sub('', note_text).strip()
             
-            note = Note(
+            note = Note.model_construct(
                 id=f"{staff_id}-note-{i}",
                 staff_id=staff_id,
                 content=clean_content,
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from enum import Enum
 
 class Priority(str, Enum):
@@ -55,13 +55,29 @@ class Reminder(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
 
+class ProgressEntry(BaseModel):
+    timestamp: datetime = Field(default_factory=datetime.now)
+    note: str
+
+    @model_validator(mode="before")
+    @classmethod
+    def _from_legacy_string(cls, value: Any) -> Any:
+        # Goals saved before structured entries hold "<isoformat>: <note>" strings
+        if isinstance(value, str):
+            stamp, sep, note = value.partition(": ")
+            try:
+                return {"timestamp": datetime.fromisoformat(stamp), "note": note} if sep else {"note": value}
+            except ValueError:
+                return {"note": value}
+        return value
+
 class Goal(BaseModel):
     id: str
     staff_id: str
     title: str
     description: Optional[str] = None
     target_date: Optional[datetime] = None
-    progress_notes: List[str] = Field(default_factory=list)
+    progress_notes: List[ProgressEntry] = Field(default_factory=list)
     status: str = "active"  # active, completed, paused, cancelled
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
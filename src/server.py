@@ -1,6 +1,11 @@
 import asyncio
+import copy
+import functools
+import hashlib
 import json
+import re
 import uuid
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, Sequence
 from mcp.server.models import InitializationOptions
@@ -12,58 +17,187 @@ from mcp.types import (
     ImageContent,
     EmbeddedResource,
 )
-from pydantic import AnyUrl
+from pydantic import AnyUrl, TypeAdapter
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+from .cached_storage import CachedStorage
 from .markdown_storage import MarkdownStorage
-from .models import StaffMember, Note, Reminder, Goal, CallTranscript, Priority
+from .models import StaffMember, Note, Reminder, Goal, CallTranscript, Priority, ProgressEntry, ReminderStatus
 
 # Initialize storage
-storage = MarkdownStorage()
+storage = CachedStorage(MarkdownStorage())
+
+def _dumps(obj) -> str:
+    """Pretty-print an already JSON-ready response, with orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one alternation that finds any of them in a single scan"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+# Transcript line classifiers, in priority order: a line containing any action
+# keyword is an action item even if it also mentions a concern or decision
+_LINE_CATEGORIES = {
+    "action": ['action', 'todo', 'follow up', 'next steps', 'will do', 'should do'],
+    "concern": ['concern', 'issue', 'problem', 'challenge', 'worried', 'risk'],
+    "decision": ['decided', 'agreed', 'conclusion', 'resolution'],
+}
+_CATEGORY_RANK = {category: rank for rank, category in enumerate(_LINE_CATEGORIES)}
+
+def _compile_line_classifier(categories: dict):
+    """Generate a classifier with every keyword inlined as a literal `in` check"""
+    source = ["def _classify_line(line_lower: str) -> int:"]
+    for rank, keywords in enumerate(categories.values()):
+        checks = " or ".join(f"{keyword!r} in line_lower" for keyword in keywords)
+        source.append(f"    if {checks}:\n        return {rank}")
+    source.append("    return -1")
+    namespace = {}
+    exec(compile("\n".join(source), "<line_classifier>", "exec"), namespace)
+    return namespace["_classify_line"]
+
+# Rank of the first category whose keywords occur in a lowercased line, or -1.
+# With keyword lists this short, per-line C substring checks beat both a
+# whole-transcript regex sweep and an Aho-Corasick automaton, whose per-hit
+# Python overhead dominates.
+_classify_line = _compile_line_classifier(_LINE_CATEGORIES)
 
-def _analyze_transcript_content(content: str, participants: list, title: str) -> dict:
+# Lowercase names the manager (James Armstrong) may appear under
+_MANAGER_NAMES = ('james armstrong', 'james')
+
+# Phrases that mark an action as the manager's own
+_SELF_ASSIGN_PHRASES = ("i will", "i'll", "i need to", "i should")
+
+# Concern severity keywords, ranked into _SEVERITY_LEVELS; the highest rank present wins
+_SEVERITY_LEVELS = ("Low", "Medium", "High")
+_SEVERITY_RANK = {
+    **dict.fromkeys(('problem', 'issue', 'challenge', 'difficulty'), 1),
+    **dict.fromkeys(('critical', 'urgent', 'serious', 'major', 'blocking'), 2),
+}
+
+# Call sentiment indicators; each distinct indicator present counts once
+_POSITIVE_INDICATORS = frozenset({"great", "excellent", "good", "positive", "success", "achievement", "happy", "pleased"})
+_NEGATIVE_INDICATORS = frozenset({"concern", "problem", "issue", "worry", "challenge", "difficult", "frustrated", "disappointed"})
+
+# Leadership behaviors and the phrases that indicate them
+_LEADERSHIP_INDICATORS = {
+    "inquiry_mindset": ("what do you think", "how do you feel", "what's your perspective", "tell me more"),
+    "empathy": ("understand", "i hear you", "that makes sense", "i can see why"),
+    "clarity": ("to be clear", "let me clarify", "specifically", "the goal is"),
+    "accountability": ("action item", "who will", "by when", "follow up", "next steps"),
+}
+
+# Simple keyword-based topic extraction
+_TOPIC_PATTERNS = {
+    topic: _keyword_pattern(keywords)
+    for topic, keywords in {
+        "project management": ["project", "timeline", "milestone", "deadline", "deliverable"],
+        "performance": ["performance", "metrics", "goals", "targets", "results"],
+        "team dynamics": ["team", "collaboration", "communication", "conflict", "working together"],
+        "technical issues": ["technical", "system", "bug", "error", "implementation"],
+        "strategy": ["strategy", "plan", "direction", "vision", "objectives"],
+        "resources": ["budget", "resources", "hiring", "staffing", "capacity"]
+    }.items()
+}
+
+# Recent transcript analyses keyed by (content digest, participants, title), oldest first
+_ANALYSIS_CACHE: OrderedDict = OrderedDict()
+_ANALYSIS_CACHE_SIZE = 256
+
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO date/datetime, building YYYY-MM-DD[ HH:MM] values directly"""
+    # int() also accepts signs, spaces, underscores and non-ASCII digits, which
+    # fromisoformat rejects, so fields take the fast path only as plain ASCII digits
+    date_digits = value[0:4] + value[5:7] + value[8:10]
+    if len(value) >= 10 and value[4] == '-' and value[7] == '-' and date_digits.isascii() and date_digits.isdigit():
+        if len(value) == 10:
+            return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+        time_digits = value[11:13] + value[14:16]
+        if len(value) == 16 and value[10] in ' T' and value[13] == ':' and time_digits.isascii() and time_digits.isdigit():
+            return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                            int(value[11:13]), int(value[14:16]))
+    return datetime.fromisoformat(value)
+
+def _analyze_transcript_content(content: str, participants: list, title: str, processed_at: str | None = None) -> dict:
     """
     Comprehensive transcript analysis providing:
     1. Action items for manager and participants
     2. Call briefing and summary
     3. HBS-style management coaching
     """
+    if processed_at is None:
+        processed_at = datetime.now().isoformat()
+    
+    key = (hashlib.blake2b(content.encode('utf-8', 'surrogatepass')).digest(), tuple(participants), title)
+    analysis = _ANALYSIS_CACHE.get(key)
+    if analysis is not None:
+        _ANALYSIS_CACHE.move_to_end(key)
+    else:
+        # Lowercase once and share it with every analyzer below
+        content_lower = content.lower()
+        lines_lower = content_lower.split('\n')
+        
+        # Classify each line by its highest-priority category
+        line_categories = {}
+        for index, line_lower in enumerate(lines_lower):
+            rank = _classify_line(line_lower)
+            if rank >= 0:
+                line_categories[index] = rank
+        
+        # The cached analysis is unstamped; every caller gets its own stamped copy
+        analysis = _build_transcript_analysis(
+            content, content_lower, lines_lower, list(participants), title, line_categories
+        )
+        _ANALYSIS_CACHE[key] = analysis
+        if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
+    
+    return {**copy.deepcopy(analysis), "processed_at": processed_at}
+
+def _build_transcript_analysis(content: str, content_lower: str, lines_lower: list, participants: list, title: str, line_categories: dict) -> dict:
+    """Assemble the unstamped analysis of one transcript from its classified lines"""
     lines = content.split('\n')
+    word_count = len(content.split())
+    participants_lower = [participant.lower() for participant in participants]
     
-    # Extract action items
-    action_items = []
+    # Extract action items as parallel content/assignee columns
+    action_contents = []
+    action_assignees = []
     concerns = []
     decisions = []
     
-    for line in lines:
-        line_lower = line.lower()
-        line_clean = line.strip()
+    for index in line_categories:
+        line_clean = lines[index].strip()
+        category = line_categories[index]
         
-        if any(word in line_lower for word in ['action', 'todo', 'follow up', 'next steps', 'will do', 'should do']):
-            action_items.append({
-                "type": "action_item",
-                "content": line_clean,
-                "assignee": _extract_assignee(line_clean, participants)
-            })
-        elif any(word in line_lower for word in ['concern', 'issue', 'problem', 'challenge', 'worried', 'risk']):
+        if category == _CATEGORY_RANK["action"]:
+            action_contents.append(line_clean)
+            action_assignees.append(_extract_assignee(lines_lower[index].strip(), participants, participants_lower))
+        elif category == _CATEGORY_RANK["concern"]:
             concerns.append({
                 "type": "concern", 
                 "content": line_clean,
-                "severity": _assess_concern_severity(line_clean)
+                "severity": _assess_concern_severity(lines_lower[index])
             })
-        elif any(word in line_lower for word in ['decided', 'agreed', 'conclusion', 'resolution']):
+        else:
             decisions.append({
                 "type": "decision",
                 "content": line_clean
             })
     
     # Generate call briefing
-    briefing = _generate_call_briefing(content, participants, title, action_items, concerns, decisions)
+    briefing = _generate_call_briefing(word_count, content_lower, participants, title, action_contents, concerns, decisions)
     
     # Generate management coaching
-    coaching = _generate_management_coaching(content, participants)
+    coaching = _generate_management_coaching(lines, content_lower, participants)
     
     # Extract manager actions vs participant actions
-    manager_actions, participant_actions = _categorize_actions(action_items, participants)
+    manager_actions, participant_actions = _categorize_actions(action_contents, action_assignees)
     
     return {
         "briefing": briefing,
@@ -72,45 +206,34 @@ def _analyze_transcript_content(content: str, participants: list, title: str) ->
         "concerns": concerns,
         "decisions": decisions,
         "management_coaching": coaching,
-        "participants": participants,
-        "processed_at": datetime.now().isoformat()
+        "participants": participants
     }
 
-def _extract_assignee(action_text: str, participants: list) -> str:
-    """Extract who is assigned to perform an action"""
-    action_lower = action_text.lower()
-    
+def _extract_assignee(action_lower: str, participants: list, participants_lower: list) -> str:
+    """Extract who is assigned to perform an already-lowercased action"""
     # Look for explicit assignments
-    for participant in participants:
-        if participant.lower() in action_lower:
+    for participant, participant_lower in zip(participants, participants_lower):
+        if participant_lower in action_lower:
             return participant
     
     # Look for "I will", "I'll", etc. patterns
-    if any(phrase in action_lower for phrase in ["i will", "i'll", "i need to", "i should"]):
+    if any(phrase in action_lower for phrase in _SELF_ASSIGN_PHRASES):
         return "Manager"
     
     return "Unassigned"
 
-def _assess_concern_severity(concern_text: str) -> str:
-    """Assess the severity of a concern"""
-    concern_lower = concern_text.lower()
-    
-    if any(word in concern_lower for word in ['critical', 'urgent', 'serious', 'major', 'blocking']):
-        return "High"
-    elif any(word in concern_lower for word in ['problem', 'issue', 'challenge', 'difficulty']):
-        return "Medium"
-    else:
-        return "Low"
+def _assess_concern_severity(concern_lower: str) -> str:
+    """Assess the severity of an already-lowercased concern"""
+    rank = max((rank for word, rank in _SEVERITY_RANK.items() if word in concern_lower), default=0)
+    return _SEVERITY_LEVELS[rank]
 
-def _generate_call_briefing(content: str, participants: list, title: str, actions: list, concerns: list, decisions: list) -> dict:
+def _generate_call_briefing(word_count: int, content_lower: str, participants: list, title: str, actions: list, concerns: list, decisions: list) -> dict:
     """Generate a structured briefing of the call"""
-    word_count = len(content.split())
-    
     # Identify key topics discussed
-    topics = _extract_key_topics(content)
+    topics = _extract_key_topics(content_lower)
     
     # Assess overall sentiment
-    sentiment = _assess_call_sentiment(content)
+    sentiment = _assess_call_sentiment(content_lower)
     
     return {
         "title": title,
@@ -124,36 +247,26 @@ def _generate_call_briefing(content: str, participants: list, title: str, action
         "decisions_count": len(decisions)
     }
 
-def _extract_key_topics(content: str) -> list:
-    """Extract key topics from conversation"""
-    # Simple keyword-based topic extraction
-    business_keywords = {
-        "project management": ["project", "timeline", "milestone", "deadline", "deliverable"],
-        "performance": ["performance", "metrics", "goals", "targets", "results"],
-        "team dynamics": ["team", "collaboration", "communication", "conflict", "working together"],
-        "technical issues": ["technical", "system", "bug", "error", "implementation"],
-        "strategy": ["strategy", "plan", "direction", "vision", "objectives"],
-        "resources": ["budget", "resources", "hiring", "staffing", "capacity"]
-    }
-    
-    content_lower = content.lower()
+def _extract_key_topics(content_lower: str) -> list:
+    """Extract key topics from (lowercased) conversation"""
     topics = []
     
-    for topic, keywords in business_keywords.items():
-        if any(keyword in content_lower for keyword in keywords):
+    for topic, pattern in _TOPIC_PATTERNS.items():
+        if pattern.search(content_lower):
             topics.append(topic)
     
     return topics[:5]  # Return top 5 topics
 
-def _assess_call_sentiment(content: str) -> str:
-    """Assess overall sentiment of the call"""
-    content_lower = content.lower()
-    
-    positive_indicators = ["great", "excellent", "good", "positive", "success", "achievement", "happy", "pleased"]
-    negative_indicators = ["concern", "problem", "issue", "worry", "challenge", "difficult", "frustrated", "disappointed"]
-    
-    positive_count = sum(1 for word in positive_indicators if word in content_lower)
-    negative_count = sum(1 for word in negative_indicators if word in content_lower)
+# Each `in` check runs CPython's C substring search (memchr/two-way), so this
+# kernel is already scan-bound; keep it to plain containment tests
+def _score_indicators(content_lower: str, indicators) -> int:
+    """Count how many distinct indicators occur in the (lowercased) content"""
+    return sum(1 for indicator in indicators if indicator in content_lower)
+
+def _assess_call_sentiment(content_lower: str) -> str:
+    """Assess overall sentiment of the (lowercased) call"""
+    positive_count = _score_indicators(content_lower, _POSITIVE_INDICATORS)
+    negative_count = _score_indicators(content_lower, _NEGATIVE_INDICATORS)
     
     if positive_count > negative_count * 1.5:
         return "Positive"
@@ -162,25 +275,22 @@ def _assess_call_sentiment(content: str) -> str:
     else:
         return "Neutral"
 
-def _categorize_actions(action_items: list, participants: list) -> tuple:
+def _categorize_actions(action_contents: list, action_assignees: list) -> tuple:
     """Separate manager actions from participant actions"""
-    manager_actions = []
-    participant_actions = []
-    
-    for action in action_items:
-        if action["assignee"] == "Manager":
-            manager_actions.append(action)
-        else:
-            participant_actions.append(action)
+    actions = [
+        {"type": "action_item", "content": content, "assignee": assignee}
+        for content, assignee in zip(action_contents, action_assignees)
+    ]
+    is_manager = [assignee == "Manager" for assignee in action_assignees]
     
+    manager_actions = [action for action, mine in zip(actions, is_manager) if mine]
+    participant_actions = [action for action, mine in zip(actions, is_manager) if not mine]
     return manager_actions, participant_actions
 
-def _generate_management_coaching(content: str, participants: list) -> dict:
+def _generate_management_coaching(lines: list, content_lower: str, participants: list) -> dict:
     """Generate HBS-style management coaching based on conversation analysis"""
-    content_lower = content.lower()
-    
     # Analyze communication patterns
-    communication_analysis = _analyze_communication_patterns(content, participants)
+    communication_analysis = _analyze_communication_patterns(lines, participants)
     
     # Assess leadership behaviors
     leadership_assessment = _assess_leadership_behaviors(content_lower)
@@ -200,27 +310,28 @@ def _generate_management_coaching(content: str, participants: list) -> dict:
         ]
     }
 
-def _analyze_communication_patterns(content: str, participants: list) -> dict:
+def _analyze_communication_patterns(lines: list, participants: list) -> dict:
     """Analyze how communication flowed in the meeting"""
-    lines = [line.strip() for line in content.split('\n') if line.strip()]
-    
     # Count speaking instances per participant
-    speaking_count = {}
+    speaking_count = Counter()
     questions_asked = 0
     
+    # "Name:" speaker prefixes, in participant order so the first match wins
+    prefixes = tuple(f"{participant}:" for participant in participants)
+    
     for line in lines:
         # Find who is speaking
-        for participant in participants:
-            if line.startswith(f"{participant}:"):
-                speaking_count[participant] = speaking_count.get(participant, 0) + 1
-                if '?' in line:
-                    questions_asked += 1
-                break
+        line = line.strip()
+        if line.startswith(prefixes):
+            speaker = next(participant for participant, prefix in zip(participants, prefixes) if line.startswith(prefix))
+            speaking_count[speaker] += 1
+            if '?' in line:
+                questions_asked += 1
     
     total_statements = sum(speaking_count.values())
     
     return {
-        "speaking_distribution": speaking_count,
+        "speaking_distribution": dict(speaking_count),
         "questions_asked": questions_asked,
         "total_exchanges": total_statements,
         "participation_balance": "Balanced" if len(set(speaking_count.values())) <= 2 else "Imbalanced"
@@ -228,32 +339,13 @@ def _analyze_communication_patterns(content: str, participants: list) -> dict:
 
 def _assess_leadership_behaviors(content_lower: str) -> dict:
     """Assess leadership behaviors demonstrated"""
-    behaviors = {
-        "inquiry_mindset": {
-            "score": 0,
-            "indicators": ["what do you think", "how do you feel", "what's your perspective", "tell me more"]
-        },
-        "empathy": {
-            "score": 0, 
-            "indicators": ["understand", "i hear you", "that makes sense", "i can see why"]
-        },
-        "clarity": {
-            "score": 0,
-            "indicators": ["to be clear", "let me clarify", "specifically", "the goal is"]
-        },
-        "accountability": {
-            "score": 0,
-            "indicators": ["action item", "who will", "by when", "follow up", "next steps"]
-        }
+    scores = {
+        behavior: _score_indicators(content_lower, indicators)
+        for behavior, indicators in _LEADERSHIP_INDICATORS.items()
     }
     
-    for behavior, data in behaviors.items():
-        for indicator in data["indicators"]:
-            if indicator in content_lower:
-                data["score"] += 1
-    
-    return {behavior: {"score": data["score"], "level": _score_to_level(data["score"])} 
-            for behavior, data in behaviors.items()}
+    return {behavior: {"score": score, "level": _score_to_level(score)} 
+            for behavior, score in scores.items()}
 
 def _score_to_level(score: int) -> str:
     """Convert score to performance level"""
@@ -308,20 +400,19 @@ def _link_transcript_to_staff(transcript: CallTranscript, analysis: dict, storag
     concerns = analysis.get('concerns', [])
     participant_actions = analysis.get('participant_actions', [])
     
+    # Resolve every participant, plus the manager, in one lookup
+    staff_by_name = storage.resolve_staff_by_names([*transcript.participants, *_MANAGER_NAMES])
+    
     # Create a summary note for each participant
+    pending_notes = []
     for participant_name in transcript.participants:
         # Skip if participant is "James Armstrong" (manager)
-        if participant_name.lower() in ['james armstrong', 'james']:
+        name_lower = participant_name.lower()
+        if name_lower in _MANAGER_NAMES:
             continue
             
         # Find staff member by name
-        all_staff = storage.get_all_staff()
-        staff_member = None
-        for staff in all_staff:
-            if staff.name.lower() == participant_name.lower():
-                staff_member = staff
-                break
-        
+        staff_member = staff_by_name.get(name_lower)
         if not staff_member:
             continue
             
@@ -333,7 +424,7 @@ def _link_transcript_to_staff(transcript: CallTranscript, analysis: dict, storag
         # Extract participant-specific actions
         participant_specific_actions = [
             action['content'] for action in participant_actions 
-            if action.get('assignee', '').lower() == participant_name.lower()
+            if action.get('assignee', '').lower() == name_lower
         ]
         
         # Build note content
@@ -352,34 +443,37 @@ def _link_transcript_to_staff(transcript: CallTranscript, analysis: dict, storag
         
         note_content = '. '.join(note_parts)
         
-        # Add note to staff member
-        storage.add_note_to_staff(
-            staff_id=staff_member.id,
-            note_content=note_content,
-            category="one_on_one" if len(transcript.participants) == 2 else "team_meeting",
-            source="call_transcript"
-        )
+        # Queue note for staff member
+        pending_notes.append((
+            staff_member.id,
+            note_content,
+            "one_on_one" if len(transcript.participants) == 2 else "team_meeting",
+            "call_transcript",
+        ))
     
     # Store leadership coaching feedback for manager (James Armstrong)
-    _store_leadership_coaching(transcript, analysis, storage)
+    coaching_note = _leadership_coaching_note(transcript, analysis, storage, staff_by_name)
+    if coaching_note:
+        pending_notes.append(coaching_note)
+    
+    # Write every staff file touched by this transcript once
+    if pending_notes:
+        storage.add_notes_bulk(pending_notes)
 
-def _store_leadership_coaching(transcript: CallTranscript, analysis: dict, storage) -> None:
-    """Store leadership coaching feedback for manager's personal development"""
+def _leadership_coaching_note(transcript: CallTranscript, analysis: dict, storage, staff_by_name: dict | None = None) -> tuple | None:
+    """Build the manager's (staff_id, content, category, source) coaching note"""
     coaching = analysis.get('management_coaching', {})
     if not coaching:
-        return
+        return None
     
     # Find James Armstrong in staff records
-    all_staff = storage.get_all_staff()
-    james_staff = None
-    for staff in all_staff:
-        if staff.name.lower() in ['james armstrong', 'james']:
-            james_staff = staff
-            break
+    if staff_by_name is None:
+        staff_by_name = storage.resolve_staff_by_names(_MANAGER_NAMES)
+    james_staff = staff_by_name.get('james armstrong') or staff_by_name.get('james')
     
     if not james_staff:
         # Create James Armstrong staff record if not exists
-        james_id = str(uuid.uuid4())
+        james_id = uuid.uuid4().hex
         james_staff = StaffMember(
             id=james_id,
             name="James Armstrong",
@@ -389,7 +483,7 @@ def _store_leadership_coaching(transcript: CallTranscript, analysis: dict, stora
         storage.save_staff(james_staff)
     
     # Extract coaching insights
-    meeting_context = f"Meeting: {transcript.title or 'Call'} with {', '.join([p for p in transcript.participants if p.lower() not in ['james armstrong', 'james']])}"
+    meeting_context = f"Meeting: {transcript.title or 'Call'} with {', '.join([p for p in transcript.participants if p.lower() not in _MANAGER_NAMES])}"
     
     # Communication analysis summary
     comm_analysis = coaching.get('communication_analysis', {})
@@ -434,434 +528,469 @@ def _store_leadership_coaching(transcript: CallTranscript, analysis: dict, stora
     
     coaching_note = '. '.join(coaching_parts)
     
-    # Store as personal development note
-    storage.add_note_to_staff(
-        staff_id=james_staff.id,
-        note_content=coaching_note,
-        category="personal_development",
-        source="hbs_leadership_coaching"
-    )
+    # File as personal development note
+    return (james_staff.id, coaching_note, "personal_development", "hbs_leadership_coaching")
+
+# List serializers, compiled once for the typed list responses
+_REMINDER_LIST = TypeAdapter(list[Reminder])
+_GOAL_LIST = TypeAdapter(list[Goal])
+
+# Rendered read-only responses, memoized per staff cache generation: any write
+# or on-disk edit bumps the generation, so stale entries are never hit again
+@functools.lru_cache(maxsize=256)
+def _staff_member_json(staff_id: str, generation: int) -> str | None:
+    """Render a staff member's JSON for get_staff_member"""
+    staff = storage.get_staff_by_id(staff_id)
+    return staff.model_dump_json(indent=2) if staff else None
+
+@functools.lru_cache(maxsize=256)
+def _staff_goals_json(staff_id: str, generation: int) -> str:
+    """Render a staff member's goals JSON for get_staff_goals"""
+    return _GOAL_LIST.dump_json(storage.get_goals_for_staff(staff_id), indent=2).decode()
+
+# Boilerplate for get_management_advice, filled in per staff member
+_ADVICE_TEMPLATE = """
+Based on the information about {name}:
+
+Role: {role}
+Department: {department}
+Recent Notes: {note_count} total notes
+Active Goals: {active_goal_count} goals
+
+Management Recommendations:
+1. Regular Check-ins: Schedule weekly 1:1s to maintain open communication
+2. Goal Alignment: Ensure their goals align with department objectives
+3. Development: Identify growth opportunities based on their interests
+4. Recognition: Acknowledge achievements and progress regularly
+5. Support: Address any concerns or roadblocks proactively
+
+For specific situations, consider the context of recent notes and their current goals.
+"""
 
 server = Server("personal-assistant")
 
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    return [
-        Tool(
-            name="add_staff_member",
-            description="Add a new staff member to the team",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Staff member's full name"},
-                    "email": {"type": "string", "description": "Email address"},
-                    "role": {"type": "string", "description": "Job title/role"},
-                    "department": {"type": "string", "description": "Department"},
-                    "team": {"type": "string", "description": "Team name"},
-                    "manager": {"type": "string", "description": "Manager's name"},
-                },
-                "required": ["name"],
-            },
-        ),
-        Tool(
-            name="update_staff_member",
-            description="Update an existing staff member's information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "staff_id": {"type": "string", "description": "Staff member ID"},
-                    "name": {"type": "string", "description": "Staff member's full name"},
-                    "email": {"type": "string", "description": "Email address"},
-                    "role": {"type": "string", "description": "Job title/role"},
-                    "department": {"type": "string", "description": "Department"},
-                    "team": {"type": "string", "description": "Team name"},
-                    "manager": {"type": "string", "description": "Manager's name"},
-                },
-                "required": ["staff_id"],
-            },
-        ),
-        Tool(
-            name="get_staff_member",
-            description="Get details for a specific staff member",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "staff_id": {"type": "string", "description": "Staff member ID"},
-                    "name": {"type": "string", "description": "Staff member name (alternative to ID)"},
-                },
+# Editable staff profile fields, shared by the add and update tools
+_STAFF_PROFILE_PROPERTIES = {
+    "name": {"type": "string", "description": "Staff member's full name"},
+    "email": {"type": "string", "description": "Email address"},
+    "role": {"type": "string", "description": "Job title/role"},
+    "department": {"type": "string", "description": "Department"},
+    "team": {"type": "string", "description": "Team name"},
+    "manager": {"type": "string", "description": "Manager's name"},
+}
+
+_TOOLS: list[Tool] = [
+    Tool(
+        name="add_staff_member",
+        description="Add a new staff member to the team",
+        inputSchema={
+            "type": "object",
+            "properties": _STAFF_PROFILE_PROPERTIES,
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="update_staff_member",
+        description="Update an existing staff member's information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "staff_id": {"type": "string", "description": "Staff member ID"},
+                **_STAFF_PROFILE_PROPERTIES,
             },
-        ),
-        Tool(
-            name="list_all_staff",
-            description="List all staff members with basic info",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+            "required": ["staff_id"],
+        },
+    ),
+    Tool(
+        name="get_staff_member",
+        description="Get details for a specific staff member",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "staff_id": {"type": "string", "description": "Staff member ID"},
+                "name": {"type": "string", "description": "Staff member name (alternative to ID)"},
             },
-        ),
-        Tool(
-            name="add_note",
-            description="Add a note about a staff member",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "staff_id": {"type": "string", "description": "Staff member ID"},
-                    "content": {"type": "string", "description": "Note content"},
-                    "category": {"type": "string", "description": "Note category (e.g., performance, personal, goals)"},
-                    "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags for the note"},
-                    "source": {"type": "string", "description": "Source of the note (e.g., one_on_one, call_transcript)"},
-                },
-                "required": ["staff_id", "content"],
+        },
+    ),
+    Tool(
+        name="list_all_staff",
+        description="List all staff members with basic info",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="add_note",
+        description="Add a note about a staff member",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "staff_id": {"type": "string", "description": "Staff member ID"},
+                "content": {"type": "string", "description": "Note content"},
+                "category": {"type": "string", "description": "Note category (e.g., performance, personal, goals)"},
+                "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags for the note"},
+                "source": {"type": "string", "description": "Source of the note (e.g., one_on_one, call_transcript)"},
             },
-        ),
-        Tool(
-            name="get_staff_notes",
-            description="Get all notes for a staff member",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "staff_id": {"type": "string", "description": "Staff member ID"},
-                },
-                "required": ["staff_id"],
+            "required": ["staff_id", "content"],
+        },
+    ),
+    Tool(
+        name="get_staff_notes",
+        description="Get all notes for a staff member",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "staff_id": {"type": "string", "description": "Staff member ID"},
             },
-        ),
-        Tool(
-            name="add_reminder",
-            description="Add a reminder for staff-related tasks",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Reminder title"},
-                    "description": {"type": "string", "description": "Detailed description"},
-                    "due_date": {"type": "string", "description": "Due date (YYYY-MM-DD or YYYY-MM-DD HH:MM)"},
-                    "staff_id": {"type": "string", "description": "Related staff member ID (optional)"},
-                    "priority": {"type": "string", "enum": ["low", "medium", "high", "urgent"], "description": "Priority level"},
-                    "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags"},
-                },
-                "required": ["title", "due_date"],
+            "required": ["staff_id"],
+        },
+    ),
+    Tool(
+        name="add_reminder",
+        description="Add a reminder for staff-related tasks",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Reminder title"},
+                "description": {"type": "string", "description": "Detailed description"},
+                "due_date": {"type": "string", "description": "Due date (YYYY-MM-DD or YYYY-MM-DD HH:MM)"},
+                "staff_id": {"type": "string", "description": "Related staff member ID (optional)"},
+                "priority": {"type": "string", "enum": [priority.value for priority in Priority], "description": "Priority level"},
+                "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags"},
             },
-        ),
-        Tool(
-            name="list_reminders",
-            description="List reminders, optionally filtered by status or staff member",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "status": {"type": "string", "enum": ["pending", "completed", "overdue"], "description": "Filter by status"},
-                    "staff_id": {"type": "string", "description": "Filter by staff member"},
-                },
+            "required": ["title", "due_date"],
+        },
+    ),
+    Tool(
+        name="list_reminders",
+        description="List reminders, optionally filtered by status or staff member",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "status": {"type": "string", "enum": [status.value for status in ReminderStatus], "description": "Filter by status; a pending reminder past its due date is listed as overdue, not pending"},
+                "staff_id": {"type": "string", "description": "Filter by staff member"},
             },
-        ),
-        Tool(
-            name="complete_reminder",
-            description="Mark a reminder as completed",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "reminder_id": {"type": "string", "description": "Reminder ID"},
-                },
-                "required": ["reminder_id"],
+        },
+    ),
+    Tool(
+        name="complete_reminder",
+        description="Mark a reminder as completed",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "reminder_id": {"type": "string", "description": "Reminder ID"},
             },
-        ),
-        Tool(
-            name="add_goal",
-            description="Add a goal for a staff member",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "staff_id": {"type": "string", "description": "Staff member ID"},
-                    "title": {"type": "string", "description": "Goal title"},
-                    "description": {"type": "string", "description": "Goal description"},
-                    "target_date": {"type": "string", "description": "Target completion date (YYYY-MM-DD)"},
-                },
-                "required": ["staff_id", "title"],
+            "required": ["reminder_id"],
+        },
+    ),
+    Tool(
+        name="add_goal",
+        description="Add a goal for a staff member",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "staff_id": {"type": "string", "description": "Staff member ID"},
+                "title": {"type": "string", "description": "Goal title"},
+                "description": {"type": "string", "description": "Goal description"},
+                "target_date": {"type": "string", "description": "Target completion date (YYYY-MM-DD)"},
             },
-        ),
-        Tool(
-            name="update_goal_progress",
-            description="Update progress on a staff member's goal",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "goal_id": {"type": "string", "description": "Goal ID"},
-                    "progress_note": {"type": "string", "description": "Progress update"},
-                    "status": {"type": "string", "enum": ["active", "completed", "paused", "cancelled"], "description": "Goal status"},
-                },
-                "required": ["goal_id", "progress_note"],
+            "required": ["staff_id", "title"],
+        },
+    ),
+    Tool(
+        name="update_goal_progress",
+        description="Update progress on a staff member's goal",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "goal_id": {"type": "string", "description": "Goal ID"},
+                "progress_note": {"type": "string", "description": "Progress update"},
+                "status": {"type": "string", "enum": ["active", "completed", "paused", "cancelled"], "description": "Goal status"},
             },
-        ),
-        Tool(
-            name="get_staff_goals",
-            description="Get all goals for a staff member",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "staff_id": {"type": "string", "description": "Staff member ID"},
-                },
-                "required": ["staff_id"],
+            "required": ["goal_id", "progress_note"],
+        },
+    ),
+    Tool(
+        name="get_staff_goals",
+        description="Get all goals for a staff member",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "staff_id": {"type": "string", "description": "Staff member ID"},
             },
-        ),
-        Tool(
-            name="process_call_transcript",
-            description="Process a call transcript to extract insights and action items",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Call/meeting title"},
-                    "content": {"type": "string", "description": "Transcript content"},
-                    "participants": {"type": "array", "items": {"type": "string"}, "description": "List of participants"},
-                },
-                "required": ["content"],
+            "required": ["staff_id"],
+        },
+    ),
+    Tool(
+        name="process_call_transcript",
+        description="Process a call transcript to extract insights and action items",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Call/meeting title"},
+                "content": {"type": "string", "description": "Transcript content"},
+                "participants": {"type": "array", "items": {"type": "string"}, "description": "List of participants"},
             },
-        ),
-        Tool(
-            name="get_management_advice",
-            description="Get AI-powered management advice for a staff member based on their notes and context",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "staff_id": {"type": "string", "description": "Staff member ID"},
-                    "situation": {"type": "string", "description": "Current situation or challenge"},
-                },
-                "required": ["staff_id"],
+            "required": ["content"],
+        },
+    ),
+    Tool(
+        name="get_management_advice",
+        description="Get AI-powered management advice for a staff member based on their notes and context",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "staff_id": {"type": "string", "description": "Staff member ID"},
+                "situation": {"type": "string", "description": "Current situation or challenge"},
             },
-        ),
-    ]
+            "required": ["staff_id"],
+        },
+    ),
+]
+
+@server.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    return _TOOLS
+
+def _tool_add_staff_member(arguments: dict) -> list[TextContent]:
+    """Add a new staff member to the team"""
+    staff_id = uuid.uuid4().hex
+    staff = StaffMember(
+        id=staff_id,
+        name=arguments["name"],
+        email=arguments.get("email"),
+        role=arguments.get("role"),
+        department=arguments.get("department"),
+        team=arguments.get("team"),
+        manager=arguments.get("manager"),
+    )
+    storage.save_staff(staff)
+    return [TextContent(type="text", text=f"Staff member {arguments['name']} added with ID: {staff_id}")]
+
+def _tool_get_staff_member(arguments: dict) -> list[TextContent]:
+    """Get details for a specific staff member"""
+    if "staff_id" in arguments:
+        staff_json = _staff_member_json(arguments["staff_id"], storage.staff_generation())
+    elif "name" in arguments:
+        staff = storage.get_staff_by_name_ci(arguments["name"])
+        staff_json = staff.model_dump_json(indent=2) if staff else None
+    else:
+        return [TextContent(type="text", text="Please provide either staff_id or name")]
+    
+    if staff_json:
+        return [TextContent(type="text", text=staff_json)]
+    else:
+        return [TextContent(type="text", text="Staff member not found")]
+
+def _tool_list_all_staff(arguments: dict) -> list[TextContent]:
+    """List all staff members with basic info"""
+    staff_list = storage.get_all_staff()
+    summary = []
+    for staff in staff_list:
+        summary.append({
+            "id": staff.id,
+            "name": staff.name,
+            "role": staff.role,
+            "department": staff.department,
+            "team": staff.team,
+            "last_one_on_one": staff.last_one_on_one.isoformat() if staff.last_one_on_one else None,
+        })
+    return [TextContent(type="text", text=_dumps(summary))]
+
+def _tool_update_staff_member(arguments: dict) -> list[TextContent]:
+    """Update an existing staff member's information"""
+    staff = storage.get_staff_by_id(arguments["staff_id"])
+    if not staff:
+        return [TextContent(type="text", text="Staff member not found")]
+    
+    # Update only provided fields
+    if "name" in arguments:
+        staff.name = arguments["name"]
+    if "email" in arguments:
+        staff.email = arguments["email"]
+    if "role" in arguments:
+        staff.role = arguments["role"]
+    if "department" in arguments:
+        staff.department = arguments["department"]
+    if "team" in arguments:
+        staff.team = arguments["team"]
+    if "manager" in arguments:
+        staff.manager = arguments["manager"]
+    
+    storage.save_staff(staff)
+    return [TextContent(type="text", text=f"Staff member {staff.name} updated successfully")]
+
+def _tool_add_note(arguments: dict) -> list[TextContent]:
+    """Add a note about a staff member"""
+    storage.add_note_to_staff(
+        staff_id=arguments["staff_id"],
+        note_content=arguments["content"],
+        category=arguments.get("category"),
+        source=arguments.get("source")
+    )
+    return [TextContent(type="text", text="Note added successfully")]
+
+def _tool_get_staff_notes(arguments: dict) -> list[TextContent]:
+    """Get all notes for a staff member"""
+    staff = storage.get_staff_by_id(arguments["staff_id"])
+    if staff:
+        return [TextContent(type="text", text=_dumps(staff.notes))]
+    else:
+        return [TextContent(type="text", text="Staff member not found")]
+
+def _tool_add_reminder(arguments: dict) -> list[TextContent]:
+    """Add a reminder for staff-related tasks"""
+    reminder_id = uuid.uuid4().hex
+    due_date = _parse_iso_datetime(arguments["due_date"])
+    reminder = Reminder(
+        id=reminder_id,
+        staff_id=arguments.get("staff_id"),
+        title=arguments["title"],
+        description=arguments.get("description"),
+        due_date=due_date,
+        priority=Priority(arguments.get("priority", "medium")),
+        tags=arguments.get("tags", []),
+    )
+    storage.save_reminder_to_markdown(reminder)
+    return [TextContent(type="text", text=f"Reminder added with ID: {reminder_id}")]
+
+def _tool_list_reminders(arguments: dict) -> list[TextContent]:
+    """List reminders, optionally filtered by status or staff member"""
+    reminders = storage.get_reminders(arguments.get("status"), arguments.get("staff_id"))
+    return [TextContent(type="text", text=_REMINDER_LIST.dump_json(reminders, indent=2).decode())]
+
+def _tool_complete_reminder(arguments: dict) -> list[TextContent]:
+    """Mark a reminder as completed"""
+    reminder = storage.get_reminder_by_id(arguments["reminder_id"])
+    if reminder:
+        reminder.status = "completed"
+        reminder.completed_at = datetime.now()
+        storage.complete_reminder(reminder)
+        return [TextContent(type="text", text="Reminder marked as completed")]
+    else:
+        return [TextContent(type="text", text="Reminder not found")]
+
+def _tool_add_goal(arguments: dict) -> list[TextContent]:
+    """Add a goal for a staff member"""
+    goal_id = uuid.uuid4().hex
+    target_date = None
+    if "target_date" in arguments:
+        target_date = _parse_iso_datetime(arguments["target_date"])
+    
+    goal = Goal(
+        id=goal_id,
+        staff_id=arguments["staff_id"],
+        title=arguments["title"],
+        description=arguments.get("description"),
+        target_date=target_date,
+    )
+    storage.save_goal(goal)
+    return [TextContent(type="text", text=f"Goal added with ID: {goal_id}")]
+
+def _tool_update_goal_progress(arguments: dict) -> list[TextContent]:
+    """Update progress on a staff member's goal"""
+    goal = storage.get_goal_by_id(arguments["goal_id"])
+    if goal:
+        goal.progress_notes.append(ProgressEntry(note=arguments["progress_note"]))
+        if "status" in arguments:
+            goal.status = arguments["status"]
+        storage.save_goal(goal)
+        return [TextContent(type="text", text="Goal progress updated")]
+    else:
+        return [TextContent(type="text", text="Goal not found")]
+
+def _tool_get_staff_goals(arguments: dict) -> list[TextContent]:
+    """Get all goals for a staff member"""
+    goals_json = _staff_goals_json(arguments["staff_id"], storage.staff_generation())
+    return [TextContent(type="text", text=goals_json)]
+
+def _tool_process_call_transcript(arguments: dict) -> list[TextContent]:
+    """Process a call transcript to extract insights and action items"""
+    transcript_id = uuid.uuid4().hex
+    now = datetime.now()
+    transcript = CallTranscript(
+        id=transcript_id,
+        date=now,
+        created_at=now,
+        title=arguments.get("title"),
+        content=arguments["content"],
+        participants=arguments.get("participants", []),
+    )
+    
+    # Enhanced transcript analysis
+    analysis = _analyze_transcript_content(
+        arguments["content"],
+        arguments.get("participants", []),
+        arguments.get("title", "Meeting"),
+        now.isoformat()
+    )
+    
+    transcript.extracted_items = analysis
+    transcript.processed = True
+    storage.save_transcript(transcript)
+    
+    # Auto-link insights to staff members
+    _link_transcript_to_staff(transcript, analysis, storage)
+    
+    return [TextContent(type="text", text=_dumps({
+        "transcript_id": transcript_id,
+        "analysis": analysis,
+        "staff_updates": "Automatically linked insights to participant profiles"
+    }))]
+
+def _tool_get_management_advice(arguments: dict) -> list[TextContent]:
+    """Get AI-powered management advice for a staff member based on their notes and context"""
+    staff = storage.get_staff_by_id(arguments["staff_id"])
+    if not staff:
+        return [TextContent(type="text", text="Staff member not found")]
+    
+    advice = _ADVICE_TEMPLATE.format_map({
+        "name": staff.name,
+        "role": staff.role or 'Not specified',
+        "department": staff.department or 'Not specified',
+        "note_count": storage.count_notes_for_staff(staff.id),
+        "active_goal_count": storage.count_active_goals_for_staff(staff.id),
+    })
+    
+    return [TextContent(type="text", text=advice)]
+
+# Tool name -> handler. Handlers are plain functions doing blocking file I/O;
+# handle_call_tool runs them off the event loop.
+_TOOL_HANDLERS = {
+    "add_staff_member": _tool_add_staff_member,
+    "get_staff_member": _tool_get_staff_member,
+    "list_all_staff": _tool_list_all_staff,
+    "update_staff_member": _tool_update_staff_member,
+    "add_note": _tool_add_note,
+    "get_staff_notes": _tool_get_staff_notes,
+    "add_reminder": _tool_add_reminder,
+    "list_reminders": _tool_list_reminders,
+    "complete_reminder": _tool_complete_reminder,
+    "add_goal": _tool_add_goal,
+    "update_goal_progress": _tool_update_goal_progress,
+    "get_staff_goals": _tool_get_staff_goals,
+    "process_call_transcript": _tool_process_call_transcript,
+    "get_management_advice": _tool_get_management_advice,
+}
+
+# Serializes tool handlers, which share the storage caches and files
+_storage_lock = asyncio.Lock()
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict | None) -> list[TextContent]:
     if arguments is None:
         arguments = {}
     
-    try:
-        if name == "add_staff_member":
-            staff_id = str(uuid.uuid4())
-            staff = StaffMember(
-                id=staff_id,
-                name=arguments["name"],
-                email=arguments.get("email"),
-                role=arguments.get("role"),
-                department=arguments.get("department"),
-                team=arguments.get("team"),
-                manager=arguments.get("manager"),
-            )
-            storage.save_staff(staff)
-            return [TextContent(type="text", text=f"Staff member {arguments['name']} added with ID: {staff_id}")]
-        
-        elif name == "get_staff_member":
-            if "staff_id" in arguments:
-                staff = storage.get_staff_by_id(arguments["staff_id"])
-            elif "name" in arguments:
-                all_staff = storage.get_all_staff()
-                staff = next((s for s in all_staff if s.name.lower() == arguments["name"].lower()), None)
-            else:
-                return [TextContent(type="text", text="Please provide either staff_id or name")]
-            
-            if staff:
-                return [TextContent(type="text", text=json.dumps(staff.model_dump(), indent=2, default=str))]
-            else:
-                return [TextContent(type="text", text="Staff member not found")]
-        
-        elif name == "list_all_staff":
-            staff_list = storage.get_all_staff()
-            summary = []
-            for staff in staff_list:
-                summary.append({
-                    "id": staff.id,
-                    "name": staff.name,
-                    "role": staff.role,
-                    "department": staff.department,
-                    "team": staff.team,
-                    "last_one_on_one": staff.last_one_on_one.isoformat() if staff.last_one_on_one else None,
-                })
-            return [TextContent(type="text", text=json.dumps(summary, indent=2, default=str))]
-        
-        elif name == "update_staff_member":
-            staff = storage.get_staff_by_id(arguments["staff_id"])
-            if not staff:
-                return [TextContent(type="text", text="Staff member not found")]
-            
-            # Update only provided fields
-            if "name" in arguments:
-                staff.name = arguments["name"]
-            if "email" in arguments:
-                staff.email = arguments["email"]
-            if "role" in arguments:
-                staff.role = arguments["role"]
-            if "department" in arguments:
-                staff.department = arguments["department"]
-            if "team" in arguments:
-                staff.team = arguments["team"]
-            if "manager" in arguments:
-                staff.manager = arguments["manager"]
-            
-            storage.save_staff(staff)
-            return [TextContent(type="text", text=f"Staff member {staff.name} updated successfully")]
-        
-        elif name == "add_note":
-            storage.add_note_to_staff(
-                staff_id=arguments["staff_id"],
-                note_content=arguments["content"],
-                category=arguments.get("category"),
-                source=arguments.get("source")
-            )
-            return [TextContent(type="text", text="Note added successfully")]
-        
-        elif name == "get_staff_notes":
-            staff = storage.get_staff_by_id(arguments["staff_id"])
-            if staff:
-                return [TextContent(type="text", text=json.dumps(staff.notes, indent=2, default=str))]
-            else:
-                return [TextContent(type="text", text="Staff member not found")]
-        
-        elif name == "add_reminder":
-            reminder_id = str(uuid.uuid4())
-            due_date = datetime.fromisoformat(arguments["due_date"])
-            reminder = Reminder(
-                id=reminder_id,
-                staff_id=arguments.get("staff_id"),
-                title=arguments["title"],
-                description=arguments.get("description"),
-                due_date=due_date,
-                priority=Priority(arguments.get("priority", "medium")),
-                tags=arguments.get("tags", []),
-            )
-            storage.save_reminder_to_markdown(reminder)
-            return [TextContent(type="text", text=f"Reminder added with ID: {reminder_id}")]
-        
-        elif name == "list_reminders":
-            reminders = storage.get_all_reminders()
-            
-            if "status" in arguments:
-                reminders = [r for r in reminders if r.status.value == arguments["status"]]
-            
-            if "staff_id" in arguments:
-                reminders = [r for r in reminders if r.staff_id == arguments["staff_id"]]
-            
-            # Check for overdue reminders
-            now = datetime.now()
-            for reminder in reminders:
-                if reminder.status.value == "pending" and reminder.due_date < now:
-                    reminder.status = "overdue"
-                    # Note: For markdown storage, we just update the status in memory
-            
-            reminders_data = [reminder.model_dump() for reminder in reminders]
-            return [TextContent(type="text", text=json.dumps(reminders_data, indent=2, default=str))]
-        
-        elif name == "complete_reminder":
-            reminders = storage.get_all_reminders()
-            reminder = next((r for r in reminders if r.id == arguments["reminder_id"]), None)
-            if reminder:
-                reminder.status = "completed"
-                reminder.completed_at = datetime.now()
-                storage.complete_reminder(reminder)
-                return [TextContent(type="text", text="Reminder marked as completed")]
-            else:
-                return [TextContent(type="text", text="Reminder not found")]
-        
-        elif name == "add_goal":
-            goal_id = str(uuid.uuid4())
-            target_date = None
-            if "target_date" in arguments:
-                target_date = datetime.fromisoformat(arguments["target_date"])
-            
-            goal = Goal(
-                id=goal_id,
-                staff_id=arguments["staff_id"],
-                title=arguments["title"],
-                description=arguments.get("description"),
-                target_date=target_date,
-            )
-            storage.save_goal(goal)
-            return [TextContent(type="text", text=f"Goal added with ID: {goal_id}")]
-        
-        elif name == "update_goal_progress":
-            all_goals = []
-            for staff in storage.get_all_staff():
-                all_goals.extend(storage.get_goals_for_staff(staff.id))
-            
-            goal = next((g for g in all_goals if g.id == arguments["goal_id"]), None)
-            if goal:
-                goal.progress_notes.append(f"{datetime.now().isoformat()}: {arguments['progress_note']}")
-                if "status" in arguments:
-                    goal.status = arguments["status"]
-                storage.save_goal(goal)
-                return [TextContent(type="text", text="Goal progress updated")]
-            else:
-                return [TextContent(type="text", text="Goal not found")]
-        
-        elif name == "get_staff_goals":
-            goals = storage.get_goals_for_staff(arguments["staff_id"])
-            goals_data = [goal.model_dump() for goal in goals]
-            return [TextContent(type="text", text=json.dumps(goals_data, indent=2, default=str))]
-        
-        elif name == "process_call_transcript":
-            transcript_id = str(uuid.uuid4())
-            transcript = CallTranscript(
-                id=transcript_id,
-                title=arguments.get("title"),
-                content=arguments["content"],
-                participants=arguments.get("participants", []),
-            )
-            
-            # Enhanced transcript analysis
-            analysis = _analyze_transcript_content(
-                arguments["content"],
-                arguments.get("participants", []),
-                arguments.get("title", "Meeting")
-            )
-            
-            transcript.extracted_items = analysis
-            transcript.processed = True
-            storage.save_transcript(transcript)
-            
-            # Auto-link insights to staff members
-            _link_transcript_to_staff(transcript, analysis, storage)
-            
-            return [TextContent(type="text", text=json.dumps({
-                "transcript_id": transcript_id,
-                "analysis": analysis,
-                "staff_updates": "Automatically linked insights to participant profiles"
-            }, indent=2))]
-        
-        elif name == "get_management_advice":
-            staff = storage.get_staff_by_id(arguments["staff_id"])
-            if not staff:
-                return [TextContent(type="text", text="Staff member not found")]
-            
-            notes = storage.get_notes_for_staff(arguments["staff_id"])
-            goals = storage.get_goals_for_staff(arguments["staff_id"])
-            
-            context = {
-                "staff_info": staff.model_dump(),
-                "recent_notes": [n.model_dump() for n in notes[-5:]],  # Last 5 notes
-                "active_goals": [g.model_dump() for g in goals if g.status == "active"],
-                "situation": arguments.get("situation", "General management guidance")
-            }
-            
-            advice = f"""
-Based on the information about {staff.name}:
-
-Role: {staff.role or 'Not specified'}
-Department: {staff.department or 'Not specified'}
-Recent Notes: {len(notes)} total notes
-Active Goals: {len([g for g in goals if g.status == 'active'])} goals
-
-Management Recommendations:
-1. Regular Check-ins: Schedule weekly 1:1s to maintain open communication
-2. Goal Alignment: Ensure their goals align with department objectives
-3. Development: Identify growth opportunities based on their interests
-4. Recognition: Acknowledge achievements and progress regularly
-5. Support: Address any concerns or roadblocks proactively
-
-For specific situations, consider the context of recent notes and their current goals.
-"""
-            
-            return [TextContent(type="text", text=advice)]
-        
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
     
+    try:
+        # One tool call touches storage at a time, so each handler's
+        # read-modify-write of the markdown files stays atomic
+        async with _storage_lock:
+            return await asyncio.to_thread(handler, arguments)
     except Exception as e:
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
@@ -1,152 +1,550 @@
 import json
 import os
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple, Type
 from pathlib import Path
-from .models import StaffMember, Note, Reminder, Goal, CallTranscript
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+from .models import StaffMember, Note, Reminder, Goal, CallTranscript, ReminderStatus
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+def _dump_line(record: Dict) -> bytes:
+    """One compact JSONL line for an already JSON-ready dict, encoded with orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, separators=(",", ":")).encode() + b"\n"
+
+def _dump_model(record: BaseModel) -> bytes:
+    """One JSONL line for a model, serialized by pydantic-core straight to bytes"""
+    return to_json(record) + b"\n"
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+def _write_lines(fds: Dict[Path, int], file_path: Path, lines: List[bytes]):
+    """Append lines to a log and fsync, through its descriptor in fds (opened and kept on first use)"""
+    fd = fds.get(file_path)
+    if fd is None:
+        fd = fds[file_path] = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    data = memoryview(b"".join(lines))
+    while data:
+        data = data[os.write(fd, data):]
+    os.fsync(fd)
+
+def _release(lock: threading.RLock, pending: Dict[Path, List[bytes]], fds: Dict[Path, int]):
+    """Finalizer for a JSONStorage: write what is still buffered, then close its descriptors"""
+    with lock:
+        for file_path, lines in pending.items():
+            try:
+                _write_lines(fds, file_path, lines)
+            except FileNotFoundError:
+                # The data directory went away before the storage did; nowhere left to write
+                pass
+        pending.clear()
+        for fd in fds.values():
+            os.close(fd)
+        fds.clear()
+
+# Whole-log validators: one call into pydantic-core per batch instead of one per record
+_LIST_ADAPTERS = {model: TypeAdapter(List[model]) for model in (StaffMember, Note, Reminder, Goal)}
 
 class JSONStorage:
+    # A log is rewritten once it holds this many lines and over twice as many as live records
+    COMPACT_MIN_LINES = 64
+    # Appended lines are buffered and written together at most this many seconds later...
+    FLUSH_DELAY = 0.05
+    # ...or as soon as this many are waiting
+    FLUSH_MAX_PENDING = 256
+    
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         
-        self.staff_file = self.data_dir / "staff.json"
-        self.notes_file = self.data_dir / "notes.json"
-        self.reminders_file = self.data_dir / "reminders.json"
-        self.goals_file = self.data_dir / "goals.json"
-        self.transcripts_file = self.data_dir / "transcripts.json"
+        # Append-only logs: one JSON record per line, the last line for an id wins
+        self.staff_file = self.data_dir / "staff.jsonl"
+        self.notes_file = self.data_dir / "notes.jsonl"
+        self.reminders_file = self.data_dir / "reminders.jsonl"
+        self.goals_file = self.data_dir / "goals.jsonl"
+        # Transcripts are large and never read back, so each gets a file of its own
+        self.transcripts_dir = self.data_dir / "transcripts"
+        
+        # file path -> {id: encoded line}, the last line written for each live record.
+        # Hashing finds an id in O(1) and the dict keeps log order, which an id-sorted list would lose
+        self._records: Dict[Path, Dict[str, bytes]] = {}
+        # file path -> {id: model} for the records built so far, see _get and _index
+        self._indexes: Dict[Path, Dict[str, Any]] = {}
+        # file path -> {staff_id: {id: None}}, the records owned by each staff member in order
+        self._by_staff: Dict[Path, Dict[str, Dict[str, None]]] = {}
+        # file path -> {id: staff_id}, so a save can find the record's previous owner
+        self._owners: Dict[Path, Dict[str, str]] = {}
+        # Ids of pending reminders, kept current by replay and save_reminder
+        self._pending_reminders: Dict[str, None] = {}
+        # file path -> lines in the log, live or superseded
+        self._line_counts: Dict[Path, int] = {}
+        # file path -> (mtime, size) the index was last in sync with, so edits by others reload it
+        self._stamps: Dict[Path, Optional[tuple]] = {}
+        
+        # Write-behind buffer: file path -> encoded lines not yet on disk
+        self._pending: Dict[Path, List[bytes]] = {}
+        self._pending_count = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._batch_depth = 0
+        # Guards the buffer and the logs against the flush timer thread
+        self._lock = threading.RLock()
+        # file path -> append-only descriptor, opened on first flush and reused after
+        self._fds: Dict[Path, int] = {}
         
         self._init_files()
+        # Holds only the buffer and descriptors, not self: runs when the storage is collected
+        # or at interpreter exit, whichever comes first
+        weakref.finalize(self, _release, self._lock, self._pending, self._fds)
     
     def _init_files(self):
-        for file_path in [self.staff_file, self.notes_file, self.reminders_file, 
-                         self.goals_file, self.transcripts_file]:
+        for file_path in [self.staff_file, self.notes_file, self.reminders_file, self.goals_file]:
             if not file_path.exists():
-                file_path.write_text("[]")
+                self._import_legacy_json(file_path)
+        if not self.transcripts_dir.exists():
+            self.transcripts_dir.mkdir()
+            self._split_legacy_transcripts()
+    
+    def _import_legacy_json(self, file_path: Path):
+        """Start a log from the matching pre-JSONL .json array, if there is one"""
+        legacy = file_path.with_suffix(".json")
+        try:
+            data = _loads(legacy.read_bytes())
+        except FileNotFoundError:
+            data = []
+        self._write_atomic(file_path, b"".join(_dump_line(item) for item in data))
+    
+    def _split_legacy_transcripts(self):
+        """Give each transcript in a pre-sharding transcripts.json its own file"""
+        legacy = self.data_dir / "transcripts.json"
+        try:
+            data = _loads(legacy.read_bytes())
+        except FileNotFoundError:
+            return
+        for item in data:
+            self._write_atomic(self._transcript_file(item["id"]), _dump_line(item))
+    
+    def _transcript_file(self, transcript_id: str) -> Path:
+        return self.transcripts_dir / f"{transcript_id}.json"
+    
+    def _write_atomic(self, file_path: Path, data: bytes):
+        """Replace a file's contents so a crash leaves either the old or the new file, never a torn one"""
+        tmp = file_path.with_suffix(file_path.suffix + ".tmp")
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, file_path)
+    
+    def _load_jsonl(self, file_path: Path) -> Iterator[Tuple[bytes, Dict]]:
+        """Yield (line, decoded record) for each line of a log"""
+        try:
+            data = file_path.read_bytes()
+        except FileNotFoundError:
+            return
+        lines = data.split(b"\n")
+        # Whatever follows the last newline: empty unless the final append was cut short by a crash
+        tail = lines.pop()
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                item = _loads(line)
+            except ValueError:
+                raise ValueError(f"{file_path}:{number}: corrupt record") from None
+            yield line + b"\n", item
+        if not tail.strip():
+            return
+        # Leave the log ending in a newline so the next append starts a line of its own
+        try:
+            item = _loads(tail)
+        except ValueError:
+            with self._lock:
+                os.truncate(file_path, len(data) - len(tail))
+            return
+        with self._lock, open(file_path, 'ab') as f:
+            f.write(b"\n")
+        yield tail + b"\n", item
+    
+    def _append_jsonl(self, file_path: Path, line: bytes):
+        with self._lock:
+            self._pending.setdefault(file_path, []).append(line)
+            self._pending_count += 1
+            self._line_counts[file_path] += 1
+            self._maybe_compact(file_path)
+            self._schedule_flush()
+    
+    def _schedule_flush(self):
+        if self._batch_depth or not self._pending:
+            return
+        if self._pending_count >= self.FLUSH_MAX_PENDING:
+            self.flush()
+        elif self._flush_timer is None:
+            # Not reset by later appends, so a steady stream of saves still lands within FLUSH_DELAY
+            self._flush_timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def flush(self):
+        """Write every buffered line to its log, one append and fsync per file"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            for file_path, lines in self._pending.items():
+                _write_lines(self._fds, file_path, lines)
+                self._stamps[file_path] = self._stat(file_path)
+            self._pending.clear()
+            self._pending_count = 0
+    
+    def _close_fd(self, file_path: Path):
+        """Forget a log's descriptor, e.g. once the file has been replaced and it points at the old one"""
+        fd = self._fds.pop(file_path, None)
+        if fd is not None:
+            os.close(fd)
+    
+    def close(self):
+        """Flush buffered writes and release the log descriptors"""
+        with self._lock:
+            self.flush()
+            for file_path in list(self._fds):
+                self._close_fd(file_path)
     
-    def _load_json(self, file_path: Path) -> List[Dict]:
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def dump_pretty(self, file_path: Path) -> str:
+        """Live records of a log as an indented JSON array, for reading by eye while debugging"""
+        return json.dumps([_loads(line) for line in self._log(file_path).values()], indent=2, ensure_ascii=False)
+    
+    @contextmanager
+    def batch(self):
+        """Hold buffered writes until the outermost batch exits, then flush them together"""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
+    
+    def _maybe_compact(self, file_path: Path):
+        lines = self._line_counts[file_path]
+        if lines >= self.COMPACT_MIN_LINES and lines > 2 * len(self._records[file_path]):
+            self._compact(file_path)
+    
+    def _compact(self, file_path: Path):
+        """Rewrite a log with one line per live record, superseding anything still buffered for it"""
+        # Reuses each record's stored line: no model is dumped or re-encoded
+        records = self._records[file_path]
+        with self._lock:
+            self._pending_count -= len(self._pending.pop(file_path, ()))
+            self._write_atomic(file_path, b"".join(records.values()))
+            self._close_fd(file_path)
+            self._line_counts[file_path] = len(records)
+            self._stamps[file_path] = self._stat(file_path)
+    
+    def _stat(self, file_path: Path) -> Optional[tuple]:
+        """Fingerprint of a log, or None if it is missing"""
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _log(self, file_path: Path) -> Dict[str, bytes]:
+        """Live records of a log as id -> line, replayed again only when the file changes under us"""
+        stamp = self._stat(file_path)
+        if file_path not in self._records or stamp is None or stamp != self._stamps.get(file_path):
+            # Replay only decodes lines to learn their ids; models are built when asked for
+            records = {}
+            self._indexes[file_path] = {}
+            self._by_staff[file_path] = {}
+            self._owners[file_path] = {}
+            reminders = file_path == self.reminders_file
+            if reminders:
+                self._pending_reminders = {}
+            lines = 0
+            for line, item in self._load_jsonl(file_path):
+                lines += 1
+                if item.get("_deleted"):
+                    records.pop(item["id"], None)
+                    self._set_owner(file_path, item["id"], None)
+                else:
+                    records[item["id"]] = line
+                    self._set_owner(file_path, item["id"], item.get("staff_id"))
+                    if reminders:
+                        self._set_pending(item["id"], item.get("status", ReminderStatus.PENDING))
+            self._records[file_path] = records
+            # The file may have been replaced rather than appended to
+            with self._lock:
+                self._close_fd(file_path)
+            self._line_counts[file_path] = lines
+            self._stamps[file_path] = self._stat(file_path)
+        return self._records[file_path]
+    
+    def _get(self, file_path: Path, model: Type[BaseModel], record_id: str) -> Optional[Any]:
+        """One model by id, validated from its line alone if it hasn't been built yet"""
+        line = self._log(file_path).get(record_id)
+        if line is None:
+            return None
+        index = self._indexes[file_path]
+        record = index.get(record_id)
+        if record is None:
+            record = index[record_id] = model.model_validate_json(line)
+        return record
+    
+    def _build(self, file_path: Path, model: Type[BaseModel], record_ids: List[str]) -> List[Any]:
+        """Models for the given ids of a replayed log, validating the ones not built yet in one batch"""
+        records = self._records[file_path]
+        index = self._indexes[file_path]
+        missing = [record_id for record_id in record_ids if record_id not in index]
+        if missing:
+            batch = b"[" + b",".join(records[record_id] for record_id in missing) + b"]"
+            index.update(zip(missing, _LIST_ADAPTERS[model].validate_json(batch)))
+        return [index[record_id] for record_id in record_ids]
+    
+    def _index(self, file_path: Path, model: Type[BaseModel]) -> Dict[str, Any]:
+        """Every model in a log keyed by id, in log order"""
+        records = self._log(file_path)
+        if len(self._indexes[file_path]) < len(records):
+            record_ids = list(records)
+            self._indexes[file_path] = dict(zip(record_ids, self._build(file_path, model, record_ids)))
+        return self._indexes[file_path]
+    
+    def _for_staff(self, file_path: Path, model: Type[BaseModel], staff_id: str) -> List[Any]:
+        """Models owned by one staff member, without touching anyone else's records"""
+        self._log(file_path)
+        return self._build(file_path, model, list(self._by_staff[file_path].get(staff_id, ())))
     
-    def _save_json(self, file_path: Path, data: List[Dict]):
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+    def _set_pending(self, reminder_id: str, status: str):
+        """Add a reminder to, or drop it from, the pending set according to its status"""
+        if status == ReminderStatus.PENDING:
+            self._pending_reminders[reminder_id] = None
+        else:
+            self._pending_reminders.pop(reminder_id, None)
+    
+    def _set_owner(self, file_path: Path, record_id: str, staff_id: Optional[str]):
+        """Move a record to staff_id in the by-staff index (None removes it)"""
+        owners = self._owners[file_path]
+        previous = owners.get(record_id)
+        if previous == staff_id:
+            return
+        by_staff = self._by_staff[file_path]
+        if previous is not None:
+            del by_staff[previous][record_id]
+            del owners[record_id]
+        if staff_id is not None:
+            by_staff.setdefault(staff_id, {})[record_id] = None
+            owners[record_id] = staff_id
+    
+    def _put(self, file_path: Path, record: BaseModel):
+        """Store record in its index and append it to the log"""
+        # Inserts and updates cost the same: a few dict assignments and one appended line, no search
+        records = self._log(file_path)
+        line = _dump_model(record)
+        records[record.id] = line
+        self._indexes[file_path][record.id] = record
+        self._set_owner(file_path, record.id, getattr(record, "staff_id", None))
+        self._append_jsonl(file_path, line)
+    
+    # Reads hand out copies so callers can't change the index without saving
     
     # Staff operations
     def get_all_staff(self) -> List[StaffMember]:
-        data = self._load_json(self.staff_file)
-        return [StaffMember(**item) for item in data]
+        return [staff.model_copy(deep=True) for staff in self._index(self.staff_file, StaffMember).values()]
     
     def get_staff_by_id(self, staff_id: str) -> Optional[StaffMember]:
-        staff_list = self.get_all_staff()
-        for staff in staff_list:
-            if staff.id == staff_id:
-                return staff
-        return None
+        staff = self._get(self.staff_file, StaffMember, staff_id)
+        return staff.model_copy(deep=True) if staff else None
     
     def save_staff(self, staff: StaffMember):
-        staff_list = self.get_all_staff()
         staff.updated_at = datetime.now()
-        
-        for i, existing in enumerate(staff_list):
-            if existing.id == staff.id:
-                staff_list[i] = staff
-                break
-        else:
-            staff_list.append(staff)
-        
-        data = [s.model_dump() for s in staff_list]
-        self._save_json(self.staff_file, data)
+        self._put(self.staff_file, staff.model_copy(deep=True))
     
     def delete_staff(self, staff_id: str) -> bool:
-        staff_list = self.get_all_staff()
-        original_length = len(staff_list)
-        staff_list = [s for s in staff_list if s.id != staff_id]
-        
-        if len(staff_list) < original_length:
-            data = [s.model_dump() for s in staff_list]
-            self._save_json(self.staff_file, data)
-            return True
-        return False
+        if self._log(self.staff_file).pop(staff_id, None) is None:
+            return False
+        self._indexes[self.staff_file].pop(staff_id, None)
+        self._append_jsonl(self.staff_file, _dump_line({"id": staff_id, "_deleted": True}))
+        return True
     
     # Notes operations
     def get_notes_for_staff(self, staff_id: str) -> List[Note]:
-        data = self._load_json(self.notes_file)
-        notes = [Note(**item) for item in data]
-        return [note for note in notes if note.staff_id == staff_id]
+        return [note.model_copy(deep=True) for note in self._for_staff(self.notes_file, Note, staff_id)]
     
     def save_note(self, note: Note):
-        data = self._load_json(self.notes_file)
-        notes = [Note(**item) for item in data]
-        
-        for i, existing in enumerate(notes):
-            if existing.id == note.id:
-                notes[i] = note
-                break
-        else:
-            notes.append(note)
-        
-        data = [n.model_dump() for n in notes]
-        self._save_json(self.notes_file, data)
+        self._put(self.notes_file, note.model_copy(deep=True))
     
     # Reminders operations
     def get_all_reminders(self) -> List[Reminder]:
-        data = self._load_json(self.reminders_file)
-        return [Reminder(**item) for item in data]
+        return [reminder.model_copy(deep=True) for reminder in self._index(self.reminders_file, Reminder).values()]
     
     def get_pending_reminders(self) -> List[Reminder]:
-        reminders = self.get_all_reminders()
-        return [r for r in reminders if r.status.value == "pending"]
+        self._log(self.reminders_file)
+        reminders = self._build(self.reminders_file, Reminder, list(self._pending_reminders))
+        return [reminder.model_copy(deep=True) for reminder in reminders]
     
     def save_reminder(self, reminder: Reminder):
-        data = self._load_json(self.reminders_file)
-        reminders = [Reminder(**item) for item in data]
-        
-        for i, existing in enumerate(reminders):
-            if existing.id == reminder.id:
-                reminders[i] = reminder
-                break
-        else:
-            reminders.append(reminder)
-        
-        data = [r.model_dump() for r in reminders]
-        self._save_json(self.reminders_file, data)
+        self._put(self.reminders_file, reminder.model_copy(deep=True))
+        self._set_pending(reminder.id, reminder.status)
     
     # Goals operations
     def get_goals_for_staff(self, staff_id: str) -> List[Goal]:
-        data = self._load_json(self.goals_file)
-        goals = [Goal(**item) for item in data]
-        return [goal for goal in goals if goal.staff_id == staff_id]
+        return [goal.model_copy(deep=True) for goal in self._for_staff(self.goals_file, Goal, staff_id)]
     
     def save_goal(self, goal: Goal):
-        data = self._load_json(self.goals_file)
-        goals = [Goal(**item) for item in data]
         goal.updated_at = datetime.now()
-        
-        for i, existing in enumerate(goals):
-            if existing.id == goal.id:
-                goals[i] = goal
-                break
-        else:
-            goals.append(goal)
-        
-        data = [g.model_dump() for g in goals]
-        self._save_json(self.goals_file, data)
+        self._put(self.goals_file, goal.model_copy(deep=True))
     
     # Transcript operations
     def save_transcript(self, transcript: CallTranscript):
-        data = self._load_json(self.transcripts_file)
-        transcripts = [CallTranscript(**item) for item in data]
+        self._write_atomic(self._transcript_file(transcript.id), _dump_model(transcript))
+
+class SQLiteStorage:
+    """Same interface as JSONStorage, kept in one SQLite database so each save touches one row"""
+    
+    def __init__(self, data_dir: str = "data"):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(exist_ok=True)
         
-        for i, existing in enumerate(transcripts):
-            if existing.id == transcript.id:
-                transcripts[i] = transcript
-                break
-        else:
-            transcripts.append(transcript)
+        self.db_file = self.data_dir / "personal.db"
+        # Autocommit: each statement is its own transaction, appended to the WAL
+        self._conn = sqlite3.connect(self.db_file, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        # The connection is shared by handler threads: one statement at a time, and an
+        # open transaction keeps other threads' statements out until it ends
+        self._lock = threading.RLock()
         
-        data = [t.model_dump() for t in transcripts]
-        self._save_json(self.transcripts_file, data)
\ No newline at end of file
+        self._init_tables()
+    
+    def _init_tables(self):
+        # Rows hold the model as JSON; staff_id and status are copied out so they can be indexed
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS staff (id TEXT PRIMARY KEY, body TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS notes (id TEXT PRIMARY KEY, staff_id TEXT NOT NULL, body TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS notes_staff_id ON notes (staff_id);
+            CREATE TABLE IF NOT EXISTS reminders (id TEXT PRIMARY KEY, status TEXT NOT NULL, body TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS reminders_status ON reminders (status);
+            CREATE TABLE IF NOT EXISTS goals (id TEXT PRIMARY KEY, staff_id TEXT NOT NULL, body TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS goals_staff_id ON goals (staff_id);
+            CREATE TABLE IF NOT EXISTS transcripts (id TEXT PRIMARY KEY, body TEXT NOT NULL);
+        """)
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+    
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        with self._lock:
+            return self._conn.execute(sql, params)
+    
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """All rows of a query, fetched before another thread can use the connection"""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+    
+    @contextmanager
+    def transaction(self):
+        """Apply every save inside the block together or not at all, e.g. a goal and the note about it"""
+        with self._lock:
+            if self._conn.in_transaction:
+                # Nested blocks join the outer transaction
+                yield self
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+    
+    # Statements are constant strings, so sqlite3's statement cache prepares each one once.
+    # ON CONFLICT ... DO UPDATE keeps the rowid, so ORDER BY rowid is insertion order like the JSON lists.
+    
+    # Staff operations
+    def get_all_staff(self) -> List[StaffMember]:
+        rows = self._query("SELECT body FROM staff ORDER BY rowid")
+        return [StaffMember.model_validate_json(body) for (body,) in rows]
+    
+    def get_staff_by_id(self, staff_id: str) -> Optional[StaffMember]:
+        rows = self._query("SELECT body FROM staff WHERE id = ?", (staff_id,))
+        return StaffMember.model_validate_json(rows[0][0]) if rows else None
+    
+    def save_staff(self, staff: StaffMember):
+        staff.updated_at = datetime.now()
+        self._execute(
+            "INSERT INTO staff (id, body) VALUES (?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET body = excluded.body",
+            (staff.id, staff.model_dump_json()),
+        )
+    
+    def delete_staff(self, staff_id: str) -> bool:
+        cursor = self._execute("DELETE FROM staff WHERE id = ?", (staff_id,))
+        return cursor.rowcount > 0
+    
+    # Notes operations
+    def get_notes_for_staff(self, staff_id: str) -> List[Note]:
+        rows = self._query("SELECT body FROM notes WHERE staff_id = ? ORDER BY rowid", (staff_id,))
+        return [Note.model_validate_json(body) for (body,) in rows]
+    
+    def save_note(self, note: Note):
+        self._execute(
+            "INSERT INTO notes (id, staff_id, body) VALUES (?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET staff_id = excluded.staff_id, body = excluded.body",
+            (note.id, note.staff_id, note.model_dump_json()),
+        )
+    
+    # Reminders operations
+    def get_all_reminders(self) -> List[Reminder]:
+        rows = self._query("SELECT body FROM reminders ORDER BY rowid")
+        return [Reminder.model_validate_json(body) for (body,) in rows]
+    
+    def get_pending_reminders(self) -> List[Reminder]:
+        rows = self._query("SELECT body FROM reminders WHERE status = 'pending' ORDER BY rowid")
+        return [Reminder.model_validate_json(body) for (body,) in rows]
+    
+    def save_reminder(self, reminder: Reminder):
+        self._execute(
+            "INSERT INTO reminders (id, status, body) VALUES (?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET status = excluded.status, body = excluded.body",
+            (reminder.id, ReminderStatus(reminder.status).value, reminder.model_dump_json()),
+        )
+    
+    # Goals operations
+    def get_goals_for_staff(self, staff_id: str) -> List[Goal]:
+        rows = self._query("SELECT body FROM goals WHERE staff_id = ? ORDER BY rowid", (staff_id,))
+        return [Goal.model_validate_json(body) for (body,) in rows]
+    
+    def save_goal(self, goal: Goal):
+        goal.updated_at = datetime.now()
+        self._execute(
+            "INSERT INTO goals (id, staff_id, body) VALUES (?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET staff_id = excluded.staff_id, body = excluded.body",
+            (goal.id, goal.staff_id, goal.model_dump_json()),
+        )
+    
+    # Transcript operations
+    def save_transcript(self, transcript: CallTranscript):
+        self._execute(
+            "INSERT INTO transcripts (id, body) VALUES (?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET body = excluded.body",
+            (transcript.id, transcript.model_dump_json()),
+        )
@@ -0,0 +1,11 @@
+import pytest
+
+from src.models import StaffMember
+
+
+@pytest.fixture
+def make_staff():
+    """Factory for staff members, defaulting to one with id s1"""
+    def make(staff_id="s1", name="Ada Lovelace", **fields):
+        return StaffMember(id=staff_id, name=name, **fields)
+    return make
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.cached_storage import CachedStorage
+from src.markdown_storage import MarkdownStorage
+from src.models import Reminder, ReminderStatus, Goal
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return CachedStorage(MarkdownStorage(str(tmp_path)))
+
+
+def test_reads_reflect_saves(storage, make_staff):
+    storage.save_staff(make_staff(role="Engineer"))
+    assert storage.get_staff_by_id("s1").role == "Engineer"
+
+    staff = storage.get_staff_by_id("s1")
+    staff.role = "Lead"
+    storage.save_staff(staff)
+    assert storage.get_staff_by_id("s1").role == "Lead"
+    assert storage.get_staff_by_name_ci("ADA LOVELACE").role == "Lead"
+
+
+def test_added_note_is_visible_immediately(storage, make_staff):
+    storage.save_staff(make_staff())
+    storage.get_staff_by_id("s1")
+    storage.add_note_to_staff("s1", "Great demo")
+    notes = storage.get_staff_by_id("s1").notes
+    assert len(notes) == 1 and notes[0].startswith("Great demo")
+    assert storage.count_notes_for_staff("s1") == 1
+
+
+def test_delete_drops_staff(storage, make_staff):
+    storage.save_staff(make_staff())
+    storage.save_staff(make_staff("s2", "Grace Hopper"))
+    assert storage.delete_staff("s2")
+    assert [s.id for s in storage.get_all_staff()] == ["s1"]
+    assert storage.get_staff_by_id("s2") is None
+
+
+def test_saved_goal_is_found_by_id(storage, make_staff):
+    storage.save_staff(make_staff())
+    storage.get_goal_by_id("s1-goal-0")
+    storage.save_goal(Goal(id="new", staff_id="s1", title="Ship it"))
+    # Markdown goals are identified by their position in the staff file
+    assert storage.get_goal_by_id("s1-goal-0").title == "Ship it"
+
+
+def test_reminder_reads_reflect_completion(storage):
+    reminder = Reminder(id="r1", title="Check in", due_date=datetime.now() + timedelta(days=1))
+    storage.save_reminder_to_markdown(reminder)
+    assert [r.id for r in storage.get_reminders(status="pending")] == ["r1"]
+
+    reminder = storage.get_reminder_by_id("r1")
+    reminder.status = "completed"
+    reminder.completed_at = datetime.now()
+    storage.complete_reminder(reminder)
+    assert storage.get_reminders(status="pending") == []
+    assert [r.id for r in storage.get_reminders(status="completed")] == ["r1"]
+
+
+def test_reads_do_not_share_lists_with_cache(storage, make_staff):
+    storage.save_staff(make_staff(skills=["python"]))
+    storage.get_staff_by_id("s1").skills.append("LEAK")
+    storage.get_all_staff()[0].skills.append("LEAK")
+    storage.get_staff_by_name_ci("ada lovelace").skills.append("LEAK")
+    assert storage.get_staff_by_id("s1").skills == ["python"]
+
+
+def test_reminder_reads_do_not_share_tags_with_cache(storage):
+    storage.save_reminder_to_markdown(
+        Reminder(id="r1", title="Check in", due_date=datetime.now() + timedelta(days=1))
+    )
+    storage.get_reminder_by_id("r1").tags.append("LEAK")
+    storage.get_all_reminders()[0].tags.append("LEAK")
+    assert storage.get_reminder_by_id("r1").tags == []
+
+
+def test_reminders_past_due_are_listed_as_overdue(storage):
+    now = datetime.now()
+    storage.save_reminder_to_markdown(Reminder(id="late", title="Late", due_date=now - timedelta(days=2)))
+    storage.save_reminder_to_markdown(Reminder(id="soon", title="Soon", due_date=now + timedelta(days=2)))
+
+    assert [r.id for r in storage.get_reminders(status="pending")] == ["soon"]
+    overdue = storage.get_reminders(status="overdue")
+    assert [(r.id, r.status) for r in overdue] == [("late", ReminderStatus.OVERDUE)]
+    assert {r.id for r in storage.get_all_reminders()} == {"late", "soon"}
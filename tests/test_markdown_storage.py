@@ -0,0 +1,163 @@
+from datetime import datetime
+
+import pytest
+
+from src.cached_storage import CachedStorage
+from src.markdown_storage import MarkdownStorage
+from src.models import Priority, Reminder, ReminderStatus
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return MarkdownStorage(str(tmp_path))
+
+
+def _write_staff_file(storage, filename, frontmatter, body="# Someone\n"):
+    (storage.staff_dir / filename).write_text(f"---\n{frontmatter}---\n\n{body}", encoding="utf-8")
+
+
+def test_malformed_staff_file_is_skipped(storage, make_staff, capsys):
+    storage.save_staff(make_staff())
+    _write_staff_file(
+        storage, "broken.md",
+        "id: bad1\nname: 12345\ncreated_at: 2024-01-01 09:00:00\nupdated_at: 2024-01-01 09:00:00\n",
+    )
+
+    assert [s.id for s in storage.get_all_staff()] == ["s1"]
+    assert storage.get_staff_by_id("bad1") is None
+    assert "Error parsing staff member" in capsys.readouterr().out
+
+    cached = CachedStorage(storage)
+    assert [s.id for s in cached.get_all_staff()] == ["s1"]
+    assert cached.get_staff_by_name_ci("ada lovelace").id == "s1"
+
+
+def _reminder(reminder_id, title, **fields):
+    return Reminder(id=reminder_id, title=title, due_date=datetime(2030, 6, 15), **fields)
+
+
+def test_reminder_detail_lines_are_parsed(storage, make_staff):
+    storage.save_staff(make_staff())
+    storage.reminders_file.write_text(
+        "# Team Management Reminders\n\n"
+        "## Pending Tasks\n\n"
+        "- 🔴 **Prepare review** (Due: 2030-06-15)\n"
+        "  - Collect peer feedback\n"
+        "  - Related to: Ada Lovelace\n"
+        "  - ID: `r1`\n\n"
+        "## Completed Tasks\n\n"
+        "- ✅ **Book room** (Completed: 2030-06-01)\n"
+        "  - ID: `r0`\n",
+        encoding="utf-8",
+    )
+
+    pending, completed = storage.get_all_reminders()
+    assert (pending.id, pending.title, pending.description) == ("r1", "Prepare review", "Collect peer feedback")
+    assert pending.staff_id == "s1"
+    assert pending.priority == Priority.HIGH
+    assert pending.status == ReminderStatus.PENDING
+    assert (completed.id, completed.status, completed.staff_id) == ("r0", ReminderStatus.COMPLETED, None)
+
+
+def test_complete_reminder_cuts_only_its_block(storage, make_staff):
+    storage.save_staff(make_staff())
+    for reminder_id in ("r1", "r2", "r3"):
+        storage.save_reminder_to_markdown(
+            _reminder(reminder_id, f"Task {reminder_id}", description=f"About {reminder_id}", staff_id="s1")
+        )
+    before = storage.reminders_file.read_text(encoding="utf-8")
+
+    storage.complete_reminder(_reminder("r2", "Task r2", description="About r2", staff_id="s1"))
+
+    after = storage.reminders_file.read_text(encoding="utf-8")
+    pending = after[after.index("## Pending Tasks"):after.index("## Completed Tasks")]
+    for reminder_id in ("r1", "r3"):
+        block_start = before.index(f"- 🟡 **Task {reminder_id}**")
+        block = before[block_start:before.index("`\n", block_start) + 2]
+        assert block in pending
+    assert "Task r2" not in pending
+    assert after.count("ID: `r2`") == 1
+
+
+def test_reminders_round_trip(storage, make_staff):
+    storage.save_staff(make_staff())
+    storage.save_reminder_to_markdown(_reminder("r1", "First", staff_id="s1", priority=Priority.URGENT))
+    storage.save_reminder_to_markdown(_reminder("r2", "Second", description="Details"))
+    storage.complete_reminder(_reminder("r1", "First", staff_id="s1"))
+
+    reminders = {r.id: r for r in storage.get_all_reminders()}
+    assert set(reminders) == {"r1", "r2"}
+    assert reminders["r1"].status == ReminderStatus.COMPLETED
+    assert reminders["r1"].staff_id == "s1"
+    assert reminders["r2"].status == ReminderStatus.PENDING
+    assert reminders["r2"].description == "Details"
+    assert reminders["r2"].due_date == datetime(2030, 6, 15)
+
+
+@pytest.mark.parametrize("notes", [[], ["Strong quarter *(2030-01-01 09:00)*"]])
+def test_appended_notes_match_full_render(storage, make_staff, notes):
+    staff = make_staff(notes=notes, skills=["python"])
+    storage.save_staff(staff)
+    now = datetime(2030, 1, 2, 3, 4, 5)
+
+    assert storage._append_staff_notes("s1", ["New note", "Another"], now)
+
+    expected = staff.model_copy(update={"notes": notes + ["New note", "Another"], "updated_at": now})
+    file_path = storage.staff_dir / "ada-lovelace.md"
+    assert file_path.read_text(encoding="utf-8") == storage._create_staff_markdown(expected, now=now)
+
+
+def test_note_on_file_without_notes_section_is_rendered_in_full(storage, make_staff):
+    storage.save_staff(make_staff())
+    file_path = storage.staff_dir / "ada-lovelace.md"
+    content = file_path.read_text(encoding="utf-8")
+    start = content.index("## Notes")
+    file_path.write_text(content[:start] + content[content.index("## Achievements"):], encoding="utf-8")
+
+    storage.add_note_to_staff("s1", "New note")
+
+    staff = storage.get_staff_by_id("s1")
+    assert len(staff.notes) == 1 and staff.notes[0].startswith("New note")
+    assert file_path.read_text(encoding="utf-8") == storage._create_staff_markdown(staff, now=staff.updated_at)
+
+
+def _frontmatter(staff_id, name):
+    return f"id: {staff_id}\nname: {name}\ncreated_at: 2024-01-01 09:00:00\nupdated_at: 2024-01-01 09:00:00\n"
+
+
+def test_index_miss_rescans_only_after_changes(storage, make_staff, monkeypatch):
+    storage.save_staff(make_staff())
+    reads = []
+    read_frontmatter = storage._read_frontmatter
+    monkeypatch.setattr(storage, "_read_frontmatter", lambda path: reads.append(path) or read_frontmatter(path))
+
+    for _ in range(3):
+        assert storage.get_staff_by_id("unknown") is None
+    storage.add_note_to_staff("s1", "No rescan for this")
+    assert storage.get_staff_by_id("unknown") is None
+    assert reads == []
+
+
+def test_index_picks_up_added_staff_file(storage, make_staff):
+    storage.save_staff(make_staff())
+    assert storage.get_staff_by_id("s2") is None
+
+    _write_staff_file(storage, "grace-hopper.md", _frontmatter("s2", "Grace Hopper"))
+    assert storage.get_staff_by_id("s2").name == "Grace Hopper"
+
+
+def test_index_picks_up_renamed_staff_file(storage, make_staff):
+    storage.save_staff(make_staff())
+    (storage.staff_dir / "ada-lovelace.md").rename(storage.staff_dir / "ada.md")
+
+    assert storage.get_staff_by_id("s1").name == "Ada Lovelace"
+    assert storage._id_to_file["s1"] == "ada.md"
+
+
+def test_index_picks_up_id_edited_in_place(storage, make_staff):
+    storage.save_staff(make_staff())
+    file_path = storage.staff_dir / "ada-lovelace.md"
+    file_path.write_text(file_path.read_text(encoding="utf-8").replace("id: s1", "id: s9"), encoding="utf-8")
+
+    assert storage.get_staff_by_id("s1") is None
+    assert storage.get_staff_by_id("s9").name == "Ada Lovelace"
@@ -0,0 +1,38 @@
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    # The server module creates its storage under ./data when imported
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp("server"))
+        from src import server
+        yield server
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2024-03-05", datetime(2024, 3, 5)),
+    ("2024-03-05 14:30", datetime(2024, 3, 5, 14, 30)),
+    ("2024-03-05T14:30", datetime(2024, 3, 5, 14, 30)),
+    ("2024-03-05T14:30:15", datetime(2024, 3, 5, 14, 30, 15)),
+])
+def test_parse_iso_datetime(server, value, expected):
+    assert server._parse_iso_datetime(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "2_24-01-01",
+    "2024-01-+1",
+    "2024-01- 1",
+    "２０２４-01-01",
+    "2024-13-01",
+    "2024-01-01 +1:30",
+    "2024-01-01 1_:30",
+    "2024-01-01T12: 5",
+    "2024-01-01 25:00",
+])
+def test_parse_iso_datetime_rejects_malformed_dates(server, value):
+    with pytest.raises(ValueError):
+        server._parse_iso_datetime(value)
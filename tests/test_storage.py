@@ -0,0 +1,183 @@
+import gc
+import threading
+import weakref
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models import Note, Reminder, Goal, ReminderStatus
+from src.storage import JSONStorage, SQLiteStorage
+
+
+def _reminder(reminder_id="r1", **fields):
+    return Reminder(id=reminder_id, title="Check in", due_date=datetime.now() + timedelta(days=1), **fields)
+
+
+@pytest.fixture
+def json_storage(tmp_path):
+    storage = JSONStorage(str(tmp_path))
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path):
+    storage = SQLiteStorage(str(tmp_path))
+    yield storage
+    storage.close()
+
+
+class TestJSONStorage:
+    def test_flush_and_reopen(self, tmp_path, json_storage, make_staff):
+        json_storage.save_staff(make_staff(skills=["python"]))
+        json_storage.save_note(Note(id="n1", staff_id="s1", content="Good sprint"))
+        json_storage.save_reminder(_reminder())
+        json_storage.save_goal(Goal(id="g1", staff_id="s1", title="Ship it"))
+        json_storage.close()
+
+        with JSONStorage(str(tmp_path)) as reopened:
+            assert reopened.get_staff_by_id("s1").skills == ["python"]
+            assert [n.content for n in reopened.get_notes_for_staff("s1")] == ["Good sprint"]
+            assert [r.id for r in reopened.get_pending_reminders()] == ["r1"]
+            assert [g.title for g in reopened.get_goals_for_staff("s1")] == ["Ship it"]
+
+    def test_updates_and_deletes_survive_reopen(self, tmp_path, json_storage, make_staff):
+        json_storage.save_staff(make_staff(name="Old"))
+        json_storage.save_staff(make_staff(name="New"))
+        json_storage.save_staff(make_staff("s2", "Gone"))
+        assert json_storage.delete_staff("s2")
+        assert not json_storage.delete_staff("s2")
+        json_storage.close()
+
+        with JSONStorage(str(tmp_path)) as reopened:
+            assert [s.name for s in reopened.get_all_staff()] == ["New"]
+
+    def test_writes_are_buffered_until_flush(self, json_storage, make_staff):
+        with json_storage.batch():
+            json_storage.save_staff(make_staff())
+            assert json_storage.staff_file.read_bytes() == b""
+        assert b'"s1"' in json_storage.staff_file.read_bytes()
+
+    def test_compaction_keeps_one_line_per_record(self, tmp_path, json_storage, make_staff):
+        saves = JSONStorage.COMPACT_MIN_LINES * 2
+        for i in range(saves):
+            json_storage.save_staff(make_staff(name=f"Name {i}"))
+        json_storage.flush()
+
+        lines = json_storage.staff_file.read_bytes().splitlines()
+        assert len(lines) < JSONStorage.COMPACT_MIN_LINES
+        json_storage.close()
+        with JSONStorage(str(tmp_path)) as reopened:
+            assert reopened.get_staff_by_id("s1").name == f"Name {saves - 1}"
+
+    def test_append_descriptor_is_reused_across_flushes(self, json_storage, make_staff):
+        json_storage.save_staff(make_staff())
+        json_storage.flush()
+        fd = json_storage._fds[json_storage.staff_file]
+        json_storage.save_staff(make_staff("s2", "Grace Hopper"))
+        json_storage.flush()
+        assert json_storage._fds[json_storage.staff_file] == fd
+
+        json_storage.close()
+        assert json_storage._fds == {}
+
+    def test_compaction_drops_stale_descriptor(self, json_storage, make_staff):
+        json_storage.save_staff(make_staff())
+        json_storage.flush()
+        json_storage._compact(json_storage.staff_file)
+        assert json_storage.staff_file not in json_storage._fds
+
+        json_storage.save_staff(make_staff(name="After compaction"))
+        json_storage.flush()
+        assert b"After compaction" in json_storage.staff_file.read_bytes()
+
+    def test_unreferenced_storage_is_collected_and_flushed(self, tmp_path, make_staff):
+        storage = JSONStorage(str(tmp_path))
+        storage.save_staff(make_staff())
+        # Leave the line in the buffer, as if the flush timer hadn't fired yet
+        timer, storage._flush_timer = storage._flush_timer, None
+        timer.cancel()
+        timer.join()
+        staff_file = storage.staff_file
+        ref = weakref.ref(storage)
+        del storage, timer
+        gc.collect()
+        assert ref() is None
+        assert b'"s1"' in staff_file.read_bytes()
+
+    def test_reads_do_not_share_lists_with_index(self, json_storage, make_staff):
+        json_storage.save_staff(make_staff(skills=["python"]))
+        json_storage.get_staff_by_id("s1").skills.append("LEAK")
+        json_storage.get_all_staff()[0].skills.append("LEAK")
+        assert json_storage.get_staff_by_id("s1").skills == ["python"]
+
+    def test_saves_do_not_share_lists_with_index(self, json_storage):
+        reminder = _reminder(tags=["weekly"])
+        json_storage.save_reminder(reminder)
+        reminder.tags.append("LEAK")
+        assert json_storage.get_all_reminders()[0].tags == ["weekly"]
+
+    def test_pending_reminders_follow_status(self, json_storage):
+        reminder = _reminder()
+        json_storage.save_reminder(reminder)
+        assert [r.id for r in json_storage.get_pending_reminders()] == ["r1"]
+        reminder.status = ReminderStatus.COMPLETED
+        json_storage.save_reminder(reminder)
+        assert json_storage.get_pending_reminders() == []
+
+
+class TestSQLiteStorage:
+    def test_save_reminder_updates_status(self, sqlite_storage):
+        reminder = _reminder()
+        sqlite_storage.save_reminder(reminder)
+        reminder.status = ReminderStatus.COMPLETED
+        sqlite_storage.save_reminder(reminder)
+        assert sqlite_storage.get_pending_reminders() == []
+        assert sqlite_storage.get_all_reminders()[0].status == ReminderStatus.COMPLETED
+
+    def test_reopen_keeps_rows(self, tmp_path, sqlite_storage, make_staff):
+        sqlite_storage.save_staff(make_staff())
+        sqlite_storage.close()
+        reopened = SQLiteStorage(str(tmp_path))
+        try:
+            assert reopened.get_staff_by_id("s1").name == "Ada Lovelace"
+        finally:
+            reopened.close()
+
+    def test_transaction_commits(self, sqlite_storage):
+        with sqlite_storage.transaction():
+            sqlite_storage.save_goal(Goal(id="g1", staff_id="s1", title="Ship it"))
+            sqlite_storage.save_note(Note(id="n1", staff_id="s1", content="Goal set"))
+        assert [g.id for g in sqlite_storage.get_goals_for_staff("s1")] == ["g1"]
+        assert [n.id for n in sqlite_storage.get_notes_for_staff("s1")] == ["n1"]
+
+    def test_nested_transaction_rolls_back_with_outer(self, sqlite_storage, make_staff):
+        sqlite_storage.save_staff(make_staff())
+        with pytest.raises(RuntimeError):
+            with sqlite_storage.transaction():
+                sqlite_storage.save_staff(make_staff("s2", "Grace Hopper"))
+                with sqlite_storage.transaction():
+                    sqlite_storage.save_note(Note(id="n1", staff_id="s1", content="Inner"))
+                raise RuntimeError("abort")
+        assert [s.id for s in sqlite_storage.get_all_staff()] == ["s1"]
+        assert sqlite_storage.get_notes_for_staff("s1") == []
+
+    def test_transaction_excludes_other_threads(self, sqlite_storage, make_staff):
+        entered = threading.Event()
+
+        def save_from_other_thread():
+            entered.set()
+            sqlite_storage.save_staff(make_staff("s2", "Grace Hopper"))
+
+        with pytest.raises(RuntimeError):
+            with sqlite_storage.transaction():
+                sqlite_storage.save_staff(make_staff())
+                worker = threading.Thread(target=save_from_other_thread)
+                worker.start()
+                entered.wait()
+                worker.join(timeout=0.2)
+                # Blocked on the lock instead of joining this transaction
+                assert worker.is_alive()
+                raise RuntimeError("abort")
+        worker.join()
+        assert [s.id for s in sqlite_storage.get_all_staff()] == ["s2"]